@@ -0,0 +1,229 @@
+"""
+Microbenchmarks for the per-call request-construction hot path.
+
+Each tool call validates a ConversionParams model, builds the request payload,
+opens a PDF.co client and serializes a BaseResponse. These benchmarks isolate
+each of those steps (plus a full in-memory MCP tool dispatch with the network
+request stubbed out) so the per-call CPU cost can be tracked over time.
+
+Usage:
+    uv run python -m benchmarks.hot_path
+    uv run python -m benchmarks.hot_path --save baseline
+    uv run python -m benchmarks.hot_path --compare baseline
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+os.environ.setdefault("X_API_KEY", "benchmark")
+
+from fastmcp import Client  # noqa: E402
+
+import pdfco.mcp  # noqa: E402
+from pdfco.mcp.models import BaseResponse, ConversionParams  # noqa: E402
+from pdfco.mcp.server import mcp  # noqa: E402
+from pdfco.mcp.services import pdf  # noqa: E402
+from pdfco.mcp.services.client import PDFCoClient  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+SOURCE_URL = (
+    "https://pdfco-test-files.s3.us-west-2.amazonaws.com/pdf-to-text/sample.pdf"
+)
+
+JOB_RESPONSE = {
+    "jobId": "benchmark-job",
+    "url": SOURCE_URL,
+    "status": "working",
+    "error": False,
+    "credits": 2,
+    "remainingCredits": 98,
+}
+
+
+def _conversion_params() -> ConversionParams:
+    return ConversionParams(
+        url=SOURCE_URL,
+        pages="0-",
+        lang="eng",
+        line_grouping="0",
+        name="output.json",
+    )
+
+
+def bench_model_validation():
+    _conversion_params()
+
+
+_PARAMS = _conversion_params()
+
+
+def bench_payload_construction():
+    _PARAMS.parse_payload(async_mode=True, endpoint="pdf/convert/to/text")
+
+
+_RESPONSE = BaseResponse(
+    status="working",
+    content=JOB_RESPONSE,
+    credits_used=2,
+    credits_remaining=98,
+    tips="You **should** use the 'wait_job_completion' tool to wait for the job [benchmark-job] to complete if a jobId is present.",
+)
+
+
+def bench_response_construction():
+    BaseResponse(
+        status="working",
+        content=JOB_RESPONSE,
+        credits_used=JOB_RESPONSE.get("credits"),
+        credits_remaining=JOB_RESPONSE.get("remainingCredits"),
+        tips="You **should** use the 'wait_job_completion' tool to wait for the job [benchmark-job] to complete if a jobId is present.",
+    )
+
+
+def bench_response_serialization():
+    _RESPONSE.model_dump_json()
+
+
+async def bench_client_creation():
+    async with PDFCoClient(api_key="benchmark"):
+        pass
+
+
+async def _stub_request(endpoint, params, custom_payload=None, api_key=None):
+    payload = params.parse_payload(async_mode=True, endpoint=endpoint)
+    if custom_payload:
+        payload.update(custom_payload)
+    return BaseResponse(
+        status="working",
+        content=JOB_RESPONSE,
+        credits_used=JOB_RESPONSE.get("credits"),
+        credits_remaining=JOB_RESPONSE.get("remainingCredits"),
+    )
+
+
+async def _run_benchmarks(number: int, repeat: int) -> dict[str, dict]:
+    results = {}
+    sync_benchmarks: dict[str, Callable[[], object]] = {
+        "model_validation": bench_model_validation,
+        "payload_construction": bench_payload_construction,
+        "response_construction": bench_response_construction,
+        "response_serialization": bench_response_serialization,
+    }
+    for name, fn in sync_benchmarks.items():
+        results[name] = _measure(lambda: _time_sync(fn, number), number, repeat)
+
+    results["client_creation"] = await _measure_async(
+        bench_client_creation, number, repeat
+    )
+
+    original_request = pdf.request
+    pdf.request = _stub_request
+    try:
+        async with Client(mcp) as client:
+
+            async def bench_tool_dispatch():
+                await client.call_tool("pdf_to_text", {"url": SOURCE_URL})
+
+            results["tool_dispatch"] = await _measure_async(
+                bench_tool_dispatch, max(number // 10, 1), repeat
+            )
+    finally:
+        pdf.request = original_request
+
+    return results
+
+
+def _time_sync(fn: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return time.perf_counter() - start
+
+
+def _measure(timer: Callable[[], float], number: int, repeat: int) -> dict:
+    timings = [timer() / number for _ in range(repeat)]
+    return _summarize(timings, number)
+
+
+async def _measure_async(
+    fn: Callable[[], Awaitable[object]], number: int, repeat: int
+) -> dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await fn()
+        timings.append((time.perf_counter() - start) / number)
+    return _summarize(timings, number)
+
+
+def _summarize(timings: list[float], number: int) -> dict:
+    return {
+        "min_us": min(timings) * 1e6,
+        "median_us": statistics.median(timings) * 1e6,
+        "loops": number,
+        "repeat": len(timings),
+    }
+
+
+def _print_report(results: dict[str, dict], baseline: dict[str, dict] | None = None):
+    header = f"{'benchmark':<24}{'min (us)':>12}{'median (us)':>14}"
+    if baseline:
+        header += f"{'baseline (us)':>16}{'change':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        line = f"{name:<24}{result['min_us']:>12.2f}{result['median_us']:>14.2f}"
+        if baseline:
+            previous = baseline.get(name)
+            if previous:
+                change = (result["min_us"] - previous["min_us"]) / previous["min_us"]
+                line += f"{previous['min_us']:>16.2f}{change:>+10.1%}"
+            else:
+                line += f"{'-':>16}{'-':>10}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="Calls per repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repeats")
+    parser.add_argument("--save", metavar="NAME", help="Store results as a baseline")
+    parser.add_argument("--compare", metavar="NAME", help="Compare with a baseline")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run_benchmarks(args.number, args.repeat))
+
+    baseline = None
+    if args.compare:
+        baseline_file = RESULTS_DIR / f"{args.compare}.json"
+        baseline = json.loads(baseline_file.read_text())["results"]
+    _print_report(results, baseline)
+
+    if args.save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        result_file = RESULTS_DIR / f"{args.save}.json"
+        result_file.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+        print(f"Saved results to {result_file}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
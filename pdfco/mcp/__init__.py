@@ -12,6 +12,7 @@ from pdfco.mcp.tools.apis import (
     document,
     extraction,
     editing,
+    result,
 )
 
 
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from functools import lru_cache
 from typing import Any
 
 
@@ -10,6 +11,16 @@ class BaseResponse(BaseModel):
     tips: str | None = None
 
 
+class PreflightInfo(BaseModel):
+    sha256: str
+    file_size: int
+    is_pdf: bool
+    page_count: int | None = None
+    encrypted: bool | None = None
+    has_text_layer: bool | None = None
+    text_pages: list[int] | None = None
+
+
 class ConversionParams(BaseModel):
     url: str = Field(
         description="URL to the source file. Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage. Use 'upload_file' tool to upload local files.",
@@ -103,57 +114,85 @@ class ConversionParams(BaseModel):
         description="Index of the worksheet to convert. (Optional)", default=""
     )
 
-    def parse_payload(self, async_mode: bool = True):
+    def parse_payload(self, async_mode: bool = True, endpoint: str | None = None):
         payload = {
             "async": async_mode,
         }
-        if self.url:
-            payload["url"] = self.url
-        if self.httpusername:
-            payload["httpusername"] = self.httpusername
-        if self.httppassword:
-            payload["httppassword"] = self.httppassword
-        if self.pages:
-            payload["pages"] = self.pages
-        if self.unwrap:
-            payload["unwrap"] = self.unwrap
-        if self.rect:
-            payload["rect"] = self.rect
-        if self.lang:
-            payload["lang"] = self.lang
-        if self.line_grouping:
-            payload["lineGrouping"] = self.line_grouping
-        if self.password:
-            payload["password"] = self.password
-        if self.name:
-            payload["name"] = self.name
-        if self.autosize:
-            payload["autosize"] = self.autosize
-
-        if self.html:
-            payload["html"] = self.html
-        if self.templateId:
-            payload["templateId"] = self.templateId
-        if self.templateData:
-            payload["templateData"] = self.templateData
-        if self.margins:
-            payload["margins"] = self.margins
-        if self.paperSize:
-            payload["paperSize"] = self.paperSize
-        if self.orientation:
-            payload["orientation"] = self.orientation
-        if self.printBackground:
-            payload["printBackground"] = self.printBackground
-        if self.mediaType:
-            payload["mediaType"] = self.mediaType
-        if self.DoNotWaitFullLoad:
-            payload["DoNotWaitFullLoad"] = self.DoNotWaitFullLoad
-        if self.header:
-            payload["header"] = self.header
-        if self.footer:
-            payload["footer"] = self.footer
-
-        if self.worksheetIndex:
-            payload["worksheetIndex"] = self.worksheetIndex
+        for field, key in _payload_fields(endpoint):
+            value = getattr(self, field)
+            if value:
+                payload[key] = value
 
         return payload
+
+
+# Request keys that differ from the ConversionParams field names
+_PAYLOAD_KEYS = {
+    "line_grouping": "lineGrouping",
+}
+
+_SOURCE_FIELDS = ("url", "httpusername", "httppassword")
+_PDF_TO_FIELDS = _SOURCE_FIELDS + (
+    "pages",
+    "unwrap",
+    "rect",
+    "lang",
+    "line_grouping",
+    "password",
+    "name",
+)
+_HTML_RENDER_FIELDS = (
+    "margins",
+    "paperSize",
+    "orientation",
+    "printBackground",
+    "mediaType",
+    "DoNotWaitFullLoad",
+    "header",
+    "footer",
+    "httpusername",
+    "httppassword",
+    "name",
+)
+
+# Fields of ConversionParams that each endpoint accepts. Endpoints ending with "/"
+# are prefixes matching every conversion target (e.g. pdf/convert/to/json2).
+# Endpoints that are not listed receive every non-empty field.
+ENDPOINT_FIELDS: dict[str, tuple[str, ...]] = {
+    "pdf/convert/to/": _PDF_TO_FIELDS,
+    "xls/convert/to/": _SOURCE_FIELDS + ("name", "worksheetIndex"),
+    "pdf/convert/from/doc": _SOURCE_FIELDS + ("autosize", "pages", "name"),
+    "pdf/convert/from/csv": _SOURCE_FIELDS + ("autosize", "pages", "name"),
+    "pdf/convert/from/image": _SOURCE_FIELDS + ("pages", "name"),
+    "pdf/convert/from/url": ("url",) + _HTML_RENDER_FIELDS,
+    "pdf/convert/from/html": ("html", "templateId", "templateData")
+    + _HTML_RENDER_FIELDS,
+    "pdf/convert/from/email": ("url", "margins", "paperSize", "orientation"),
+    "pdf/merge2": _SOURCE_FIELDS + ("name",),
+    "pdf/split": _SOURCE_FIELDS + ("pages", "password", "name"),
+    "pdf/info": _SOURCE_FIELDS + ("password",),
+    "pdf/info/fields": _SOURCE_FIELDS + ("password",),
+    "pdf/edit/add": _SOURCE_FIELDS + ("password", "name"),
+    "pdf/find": _SOURCE_FIELDS + ("pages", "password"),
+    "pdf/find/table": _SOURCE_FIELDS + ("pages", "password"),
+    "pdf/makesearchable": _SOURCE_FIELDS + ("lang", "pages", "password", "name"),
+    "pdf/makeunsearchable": _SOURCE_FIELDS + ("pages", "password", "name"),
+    "pdf/security/add": _SOURCE_FIELDS + ("password", "name"),
+    "pdf/security/remove": _SOURCE_FIELDS + ("password", "name"),
+    "pdf/attachments/extract": _SOURCE_FIELDS + ("password",),
+    "ai-invoice-parser": ("url",),
+}
+
+
+@lru_cache(maxsize=None)
+def _payload_fields(endpoint: str | None) -> tuple[tuple[str, str], ...]:
+    """
+    Compile the (field, request key) pairs emitted for an endpoint
+    """
+    fields = ENDPOINT_FIELDS.get(endpoint) if endpoint else None
+    if fields is None and endpoint:
+        prefix = endpoint.rsplit("/", 1)[0] + "/"
+        fields = ENDPOINT_FIELDS.get(prefix)
+    if fields is None:
+        fields = tuple(ConversionParams.model_fields)
+    return tuple((field, _PAYLOAD_KEYS.get(field, field)) for field in fields)
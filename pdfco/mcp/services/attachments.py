@@ -0,0 +1,125 @@
+import hashlib
+import time
+from urllib.parse import unquote, urlsplit
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    SKIPPED_ERROR,
+    gather_limited,
+    skipped_response,
+)
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.output import fetch_output
+from pdfco.mcp.services.pdf import extract_pdf_attachments
+
+
+async def extract_attachments_recursive(
+    params: ConversionParams,
+    max_depth: int = 3,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+) -> BaseResponse:
+    """
+    Extract the attachments of a PDF and, level by level up to `max_depth`,
+    the attachments of attached PDFs. The PDFs of a level are processed
+    concurrently. Attachments with identical content are listed once and not
+    processed again. Returns a flat manifest of all attachments.
+    """
+    start_time = time.time()
+    manifest: list[dict] = []
+    errors: list[dict] = []
+    first_by_hash: dict[str, str] = {}
+    credits_used = 0
+    credits_remaining = None
+
+    async def extract(item: tuple[str, int]) -> BaseResponse:
+        url, depth = item
+        # Only the source PDF needs the credentials, attachments are PDF.co files
+        source_params = params if depth == 0 else ConversionParams(url=url)
+        return await complete_job(
+            await extract_pdf_attachments(source_params, api_key=api_key),
+            api_key=api_key,
+        )
+
+    level = [(params.url, 0)]
+    async with PDFCoClientPool(api_key=api_key):
+        for depth in range(max(max_depth, 1)):
+            if not level:
+                break
+            results = await gather_limited(
+                extract, level, concurrency, skipped=skipped_response
+            )
+            found = []
+            for (url, _), result in zip(level, results):
+                credits_used += result.credits_used or 0
+                credits_remaining = result.credits_remaining or credits_remaining
+                if result.status != "success":
+                    errors.append({"source": url, "error": result.content})
+                    continue
+                found.extend(
+                    (item, url, depth + 1) for item in result.content.get("urls") or []
+                )
+            # All attachments of a level are downloaded under one limit
+            attachments = await gather_limited(
+                lambda item: _describe(*item),
+                found,
+                concurrency,
+                skipped=lambda item: {
+                    "url": item[0],
+                    "parent": item[1],
+                    "depth": item[2],
+                    "error": SKIPPED_ERROR,
+                },
+            )
+            next_level = []
+            for attachment in attachments:
+                manifest.append(attachment)
+                digest = attachment.get("sha256")
+                if digest is None:
+                    continue
+                if digest in first_by_hash:
+                    attachment["duplicate_of"] = first_by_hash[digest]
+                    continue
+                first_by_hash[digest] = attachment["url"]
+                if attachment["is_pdf"]:
+                    next_level.append((attachment["url"], depth + 1))
+            level = next_level
+
+    return BaseResponse(
+        status="error" if errors and not manifest else "success",
+        content={
+            "attachments": manifest,
+            "unique": len(first_by_hash),
+            "duplicates": sum("duplicate_of" in item for item in manifest),
+            "unprocessed": [url for url, _ in level],
+            "errors": errors,
+            "duration": round(time.time() - start_time, 3),
+        },
+        credits_used=credits_used,
+        credits_remaining=credits_remaining,
+        tips="Attached PDFs deeper than max_depth are listed in 'unprocessed'"
+        if level
+        else "All attachments are already extracted, no need to wait for them",
+    )
+
+
+async def _describe(url: str, parent: str, depth: int) -> dict:
+    attachment = {
+        "url": url,
+        "name": unquote(urlsplit(url).path.rsplit("/", 1)[-1]),
+        "parent": parent,
+        "depth": depth,
+    }
+    try:
+        # Attachments are only hashed, keep them out of the output cache
+        content = await fetch_output(url, use_cache=False)
+    except Exception as e:
+        return {**attachment, "error": str(e)}
+    return {
+        **attachment,
+        "size": len(content),
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "is_pdf": b"%PDF-" in content[:1024],
+    }
@@ -0,0 +1,73 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+from pdfco.mcp.models import BaseResponse
+from pdfco.mcp.services.deadline import check_deadline
+
+T = TypeVar("T")
+
+# Default number of items a batch tool processes at the same time
+DEFAULT_CONCURRENCY = int(os.getenv("PDFCO_BATCH_CONCURRENCY", "8"))
+
+# Error of batch items that were not started because the deadline passed
+SKIPPED_ERROR = "Skipped: deadline exceeded"
+
+
+def skipped_response(item: Any = None) -> BaseResponse:
+    """
+    Result of a batch item that was not started because the deadline passed
+    """
+    return BaseResponse(status="error", content=SKIPPED_ERROR)
+
+
+async def gather_limited(
+    func: Callable[[T], Awaitable[Any]],
+    items: Iterable[T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    skipped: Callable[[T], Any] | None = None,
+) -> list:
+    """
+    Run func over items with at most `concurrency` of them in flight, returning
+    the results in input order. API requests are additionally bounded across all
+    calls by the client's request limiter. Items are not started past the
+    current deadline: their result is `skipped(item)`, or the call fails with
+    TimeoutError if `skipped` is not given. A failing item doesn't stop the
+    others, its error is raised once all are done. If the call is cancelled,
+    the items still running are cancelled instead of being left behind.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(item: T):
+        async with semaphore:
+            try:
+                check_deadline()
+            except TimeoutError:
+                if skipped is None:
+                    raise
+                return skipped(item)
+            return await func(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    if not tasks:
+        return []
+    try:
+        await asyncio.wait(tasks)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    errors = [task.exception() for task in tasks]
+    for error in errors:
+        if error is not None:
+            raise error
+    return [task.result() for task in tasks]
+
+
+def numbered_name(name: str, index: int, extension: str = "pdf") -> str:
+    """
+    Output file name for the item at `index` of a batch, e.g. 'invoice-3.pdf'
+    """
+    stem, _, suffix = name.rpartition(".")
+    return f"{stem or suffix}-{index + 1}.{extension}"
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+CACHE_DIR = Path(
+    os.getenv("PDFCO_CACHE_DIR") or Path.home() / ".cache" / "pdfco-mcp"
+).expanduser()
+
+
+class LRUCache:
+    """
+    In-memory LRU cache bounded by the number of entries and, optionally, by the
+    total size of the cached values
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_size: int | None = None,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.size = 0
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, value) -> bool:
+        """
+        Cache a value, evicting the least recently used entries to make room.
+        Returns False if the value is larger than the cache itself.
+        """
+        size = self.sizeof(value) if self.max_size is not None else 0
+        if self.max_size is not None and size > self.max_size:
+            self.pop(key)
+            return False
+        self.pop(key)
+        self._entries[key] = value
+        self.size += size
+        while len(self._entries) > self.max_entries or (
+            self.max_size is not None and self.size > self.max_size
+        ):
+            self.pop(next(iter(self._entries)))
+        return True
+
+    def pop(self, key, default=None):
+        if key not in self._entries:
+            return default
+        value = self._entries.pop(key)
+        if self.max_size is not None:
+            self.size -= self.sizeof(value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+
+class PersistentCache:
+    """
+    JSON values stored as files in the local cache directory, so they survive
+    server restarts. Entries can carry a validator (e.g. the ETag of the source
+    file) that must match on read, expire after a TTL, and the least recently
+    used entries are evicted beyond max_entries.
+    """
+
+    def __init__(
+        self, namespace: str, max_entries: int = 1024, ttl: float | None = None
+    ):
+        self.directory = CACHE_DIR / namespace
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Number of entries on disk, counted on first write and kept up to date
+        # so that writes only scan the directory when eviction is due
+        self._count: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(
+        self,
+        key: str,
+        validator: str | None = None,
+        max_age: float | None = None,
+    ) -> Any | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        age = time.time() - entry["stored_at"]
+        ttl = min(t for t in (self.ttl, max_age, float("inf")) if t is not None)
+        if age > ttl or entry.get("validator") != validator:
+            self.pop(key)
+            return None
+        os.utime(path)
+        return entry["value"]
+
+    def contains(self, key: str) -> bool:
+        """
+        Whether an entry is stored for the key, without validating it
+        """
+        return self._path(key).exists()
+
+    def put(self, key: str, value: Any, validator: str | None = None):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        if self._count is None:
+            self._count = sum(1 for _ in self.directory.glob("*.json"))
+        if not path.exists():
+            self._count += 1
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(
+            json.dumps(
+                {
+                    "key": key,
+                    "stored_at": time.time(),
+                    "validator": validator,
+                    "value": value,
+                },
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, path)
+        self._evict()
+
+    def pop(self, key: str):
+        path = self._path(key)
+        if path.exists() and self._count:
+            self._count -= 1
+        path.unlink(missing_ok=True)
+
+    def _evict(self):
+        if self._count is not None and self._count <= self.max_entries:
+            return
+        entries = list(self.directory.glob("*.json"))
+        entries.sort(key=_mtime)
+        for entry in entries[: max(len(entries) - self.max_entries, 0)]:
+            entry.unlink(missing_ok=True)
+        self._count = min(len(entries), self.max_entries)
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0
@@ -1,13 +1,26 @@
+import asyncio
 from contextlib import asynccontextmanager
-from httpx import AsyncClient
+from contextvars import ContextVar
+from httpx import AsyncClient, AsyncHTTPTransport, Limits, Request, Response
 import os
 import sys
 from typing import AsyncGenerator
 import importlib.metadata
 
+from pdfco.mcp.services.deadline import BATCH_TIMEOUT, deadline
+
 __BASE_URL = "https://api.pdf.co"
 X_API_KEY = os.getenv("X_API_KEY")
 
+# Upper bound of concurrent requests to the PDF.co API, shared by all tool calls
+MAX_CONCURRENT_REQUESTS = int(os.getenv("PDFCO_MAX_CONCURRENT_REQUESTS", "10"))
+_request_limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# (API key, client) shared by every PDFCoClient opened inside a PDFCoClientPool
+_pooled_client: ContextVar[tuple[str, AsyncClient] | None] = ContextVar(
+    "pdfco_pooled_client", default=None
+)
+
 __version__ = importlib.metadata.version("pdfco-mcp")
 print(f"pdfco-mcp version: {__version__}", file=sys.stderr)
 
@@ -17,6 +30,11 @@ async def PDFCoClient(api_key: str | None = None) -> AsyncGenerator[AsyncClient,
     # Use provided API key, fall back to environment variable
     x_api_key = api_key or X_API_KEY
 
+    pooled = _pooled_client.get()
+    if pooled is not None and pooled[0] == x_api_key:
+        yield pooled[1]
+        return
+
     if not x_api_key:
         raise ValueError("""API key is required. Please provide an API key as a parameter or set X_API_KEY in the environment variables.
         
@@ -51,8 +69,42 @@ async def PDFCoClient(api_key: str | None = None) -> AsyncGenerator[AsyncClient,
             "x-api-key": x_api_key,
             "User-Agent": f"pdfco-mcp/{__version__}",
         },
+        transport=_LimitedTransport(
+            limits=Limits(max_connections=MAX_CONCURRENT_REQUESTS)
+        ),
     )
     try:
         yield client
     finally:
         await client.aclose()
+
+
+@asynccontextmanager
+async def PDFCoClientPool(
+    api_key: str | None = None,
+    timeout: float | None = BATCH_TIMEOUT,
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Share one client and its connection pool with every PDFCoClient opened inside
+    this block (including concurrent tasks started from it), instead of setting up
+    a new client and TLS connection per request. The work inside the block
+    shares a deadline of `timeout` seconds, if set.
+    """
+    with deadline(timeout):
+        async with PDFCoClient(api_key=api_key) as client:
+            token = _pooled_client.set((api_key or X_API_KEY, client))
+            try:
+                yield client
+            finally:
+                _pooled_client.reset(token)
+
+
+class _LimitedTransport(AsyncHTTPTransport):
+    """
+    Transport that keeps the number of in-flight API requests under
+    MAX_CONCURRENT_REQUESTS across all clients
+    """
+
+    async def handle_async_request(self, request: Request) -> Response:
+        async with _request_limiter:
+            return await super().handle_async_request(request)
@@ -0,0 +1,242 @@
+import time
+from html.parser import HTMLParser
+from typing import Awaitable, Callable
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from httpx import AsyncClient
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    gather_limited,
+    numbered_name,
+)
+from pdfco.mcp.services.client import PDFCoClientPool, __version__
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.merge import merge_tree
+from pdfco.mcp.services.pdf import convert_from
+
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str, base: str = "") -> str | None:
+    """
+    Absolute form of a link used to dedupe pages: the fragment and default port
+    are dropped and the scheme and host lowercased. Returns None for links that
+    are not http(s) pages, like mailto: or javascript:.
+    """
+    parts = urlsplit(urljoin(base, url.strip()))
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return None
+    netloc = parts.hostname
+    if parts.port and parts.port != _DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{parts.port}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+class LinkParser(HTMLParser):
+    """
+    Collects the targets of <a href> links in document order, honoring <base href>
+    """
+
+    def __init__(self, base_url: str):
+        super().__init__()
+        self.base_url = base_url
+        self.links: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        href = dict(attrs).get("href")
+        if not href:
+            return
+        if tag == "base":
+            self.base_url = urljoin(self.base_url, href)
+        elif tag == "a":
+            self.links.append(href)
+
+
+def extract_links(html: str, base_url: str) -> list[str]:
+    """
+    Normalized http(s) links of a page, deduped in document order
+    """
+    parser = LinkParser(base_url)
+    parser.feed(html)
+    parser.close()
+    links = (normalize_url(href, parser.base_url) for href in parser.links)
+    return list(dict.fromkeys(link for link in links if link))
+
+
+async def crawl_to_pdf(
+    seeds: list[str],
+    params: ConversionParams,
+    max_depth: int = 1,
+    max_pages: int = 20,
+    same_host: bool = True,
+    merge: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+    on_page: Callable[[dict, int, int], Awaitable[None]] | None = None,
+) -> BaseResponse:
+    """
+    Crawl from the seed URLs breadth first, following links up to `max_depth`
+    levels deep and at most `max_pages` pages, and convert each page to PDF
+    with pdf/convert/from/url. Pages of a level are fetched and converted
+    concurrently; linked pages that fail to load or aren't HTML are skipped.
+    With `merge`, the PDFs are merged in crawl order. `on_page` receives each
+    finished page with the number of pages finished and found.
+    """
+    seeds = list(dict.fromkeys(filter(None, map(normalize_url, seeds))))
+    if not seeds:
+        raise ValueError("No http(s) seed URLs to crawl")
+
+    start_time = time.time()
+    hosts = {urlsplit(seed).hostname for seed in seeds}
+    seen = set(seeds[:max_pages])
+    level = seeds[:max_pages]
+    queued = len(level)
+    pages: list[dict] = []
+    finished = 0
+    credits_used = 0
+    credits_remaining = None
+    auth = (params.httpusername, params.httppassword) if params.httpusername else None
+
+    async def visit(item: tuple[int, str, int]) -> tuple[dict, list[str]]:
+        index, url, depth = item
+        page = {"url": url, "depth": depth}
+        links: list[str] = []
+        fetch_start = time.time()
+        try:
+            async with client.stream("GET", url, auth=auth) as response:
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "")
+                is_html = content_type.startswith(_HTML_CONTENT_TYPES)
+                # Only pages whose links are followed are read, by their headers
+                if is_html and depth < max_depth:
+                    await response.aread()
+        except Exception as e:
+            if depth > 0:
+                page.update(status="skipped", reason=f"fetch failed ({e})")
+                return page, links
+            # PDF.co may still be able to load a seed, convert it anyway
+            page["fetch_error"] = str(e)
+        else:
+            final_url = normalize_url(str(response.url)) or url
+            if final_url != url:
+                page["redirected_to"] = final_url
+                if final_url in seen:
+                    page.update(status="skipped", reason="duplicate")
+                    return page, links
+                seen.add(final_url)
+            if not is_html:
+                if depth > 0:
+                    page.update(status="skipped", reason=f"not HTML ({content_type})")
+                    return page, links
+            elif depth < max_depth:
+                links = extract_links(response.text, final_url)
+        page["fetch_time"] = round(time.time() - fetch_start, 3)
+        page["links"] = len(links)
+
+        convert_start = time.time()
+        # With merge, the name is kept for the merged PDF
+        update = {"url": url, "name": ""}
+        if params.name and not merge:
+            update["name"] = numbered_name(params.name, index)
+        result = await complete_job(
+            await convert_from(
+                "pdf", "url", params.model_copy(update=update), api_key=api_key
+            ),
+            api_key=api_key,
+        )
+        page["convert_time"] = round(time.time() - convert_start, 3)
+        page["credits_used"] = result.credits_used or 0
+        page["credits_remaining"] = result.credits_remaining
+        if result.status == "success":
+            page.update(status="success", pdf_url=result.content.get("url"))
+        else:
+            page.update(status="error", error=result.content)
+        return page, links
+
+    async def visit_reported(item: tuple[int, str, int]) -> tuple[dict, list[str]]:
+        nonlocal finished
+        page, links = await visit(item)
+        finished += 1
+        if on_page:
+            await on_page(page, finished, queued)
+        return page, links
+
+    depth = 0
+    async with (
+        AsyncClient(
+            follow_redirects=True, headers={"User-Agent": f"pdfco-mcp/{__version__}"}
+        ) as client,
+        PDFCoClientPool(api_key=api_key),
+    ):
+        while level:
+            offset = len(pages)
+            results = await gather_limited(
+                visit_reported,
+                [(offset + i, url, depth) for i, url in enumerate(level)],
+                concurrency,
+                skipped=lambda item: (
+                    {
+                        "url": item[1],
+                        "depth": item[2],
+                        "status": "skipped",
+                        "reason": "deadline exceeded",
+                    },
+                    [],
+                ),
+            )
+            next_level = []
+            for page, links in results:
+                credits_used += page.pop("credits_used", 0)
+                credits_remaining = (
+                    page.pop("credits_remaining", None) or credits_remaining
+                )
+                for link in links:
+                    if queued >= max_pages:
+                        break
+                    if link in seen or (
+                        same_host and urlsplit(link).hostname not in hosts
+                    ):
+                        continue
+                    seen.add(link)
+                    next_level.append(link)
+                    queued += 1
+            pages.extend(page for page, _ in results)
+            level = next_level
+            depth += 1
+
+    converted = [page for page in pages if page["status"] == "success"]
+    failed = sum(page["status"] == "error" for page in pages)
+    content = {
+        "pages": pages,
+        "converted": len(converted),
+        "skipped": sum(page["status"] == "skipped" for page in pages),
+        "failed": failed,
+        "duration": round(time.time() - start_time, 3),
+    }
+    if merge and converted:
+        merged = await merge_tree(
+            [page["pdf_url"] for page in converted],
+            ConversionParams(name=params.name),
+            concurrency=concurrency,
+            api_key=api_key,
+        )
+        credits_used += merged.credits_used or 0
+        credits_remaining = merged.credits_remaining or credits_remaining
+        if merged.status == "success":
+            content["url"] = merged.content["url"]
+        else:
+            content["merge_error"] = merged.content
+            failed += 1
+        content["duration"] = round(time.time() - start_time, 3)
+
+    return BaseResponse(
+        status="success" if failed == 0 and converted else "error",
+        content=content,
+        credits_used=credits_used,
+        credits_remaining=credits_remaining,
+        tips="All pages are already converted, no need to wait for them",
+    )
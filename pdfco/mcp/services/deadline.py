@@ -0,0 +1,44 @@
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator
+
+# Default time limit of a batch, in seconds, 0 for none
+BATCH_TIMEOUT = float(os.getenv("PDFCO_BATCH_TIMEOUT", "0"))
+
+# Monotonic time by which the current tool call must finish, shared by every
+# task started from it
+_deadline: ContextVar[float | None] = ContextVar("pdfco_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Generator[None, None, None]:
+    """
+    Limit the work inside this block to `seconds`. An enclosing deadline that
+    is sooner is kept. No limit is added if `seconds` is empty or 0.
+    """
+    if not seconds or seconds <= 0:
+        yield
+        return
+    current = _deadline.get()
+    until = time.monotonic() + seconds
+    token = _deadline.set(until if current is None else min(current, until))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_left() -> float | None:
+    """
+    Seconds left until the current deadline, None if there is none
+    """
+    until = _deadline.get()
+    return None if until is None else until - time.monotonic()
+
+
+def check_deadline():
+    left = time_left()
+    if left is not None and left <= 0:
+        raise TimeoutError("Deadline exceeded")
@@ -0,0 +1,123 @@
+import io
+import time
+import zipfile
+from xml.etree import ElementTree
+
+from httpx import AsyncClient
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    gather_limited,
+    skipped_response,
+)
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.pdf import convert_to
+
+# Output formats of xls/convert/to/{format}
+EXCEL_OUTPUTS = ("csv", "json", "html", "txt", "xml", "pdf")
+
+# Index of the first worksheet in the worksheetIndex parameter
+FIRST_WORKSHEET_INDEX = 1
+
+_SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def read_xlsx_sheet_names(content: bytes) -> list[str]:
+    """
+    Names of the worksheets of an XLSX workbook in workbook order, read from
+    xl/workbook.xml without loading the sheets
+    """
+    with zipfile.ZipFile(io.BytesIO(content)) as workbook:
+        root = ElementTree.fromstring(workbook.read("xl/workbook.xml"))
+    return [sheet.get("name", "") for sheet in root.iter(f"{_SPREADSHEET_NS}sheet")]
+
+
+async def discover_sheets(params: ConversionParams, sheet_count: int = 0) -> list[str]:
+    """
+    Worksheet names of a workbook. XLSX workbooks are read locally; legacy XLS
+    workbooks can't be, so their number of sheets must be given and they are
+    named by position.
+    """
+    if sheet_count > 0:
+        return [f"Sheet{index + 1}" for index in range(sheet_count)]
+
+    async with AsyncClient(follow_redirects=True) as client:
+        response = await client.get(
+            params.url,
+            auth=(params.httpusername, params.httppassword)
+            if params.httpusername
+            else None,
+        )
+        response.raise_for_status()
+    if not zipfile.is_zipfile(io.BytesIO(response.content)):
+        raise ValueError(
+            "Sheet names can only be discovered for XLSX workbooks, set sheet_count for XLS workbooks"
+        )
+    return read_xlsx_sheet_names(response.content)
+
+
+async def convert_all_sheets(
+    params: ConversionParams,
+    output: str,
+    sheet_count: int = 0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+) -> BaseResponse:
+    """
+    Convert every worksheet of a workbook with concurrent xls/convert/to jobs,
+    returning a mapping of sheet name to output URL
+    """
+    if output not in EXCEL_OUTPUTS:
+        raise ValueError(
+            f"Unsupported output '{output}', use one of: {', '.join(EXCEL_OUTPUTS)}"
+        )
+
+    start_time = time.time()
+    sheets = await discover_sheets(params, sheet_count)
+
+    async def convert(item: tuple[int, str]) -> BaseResponse:
+        position, sheet = item
+        update = {"worksheetIndex": str(position + FIRST_WORKSHEET_INDEX)}
+        if params.name:
+            stem = params.name.rpartition(".")[0] or params.name
+            update["name"] = f"{stem}-{sheet}.{output}"
+        return await complete_job(
+            await convert_to(
+                "xls", output, params.model_copy(update=update), api_key=api_key
+            ),
+            api_key=api_key,
+        )
+
+    async with PDFCoClientPool(api_key=api_key):
+        results = await gather_limited(
+            convert,
+            list(enumerate(sheets)),
+            concurrency,
+            skipped=skipped_response,
+        )
+
+    outputs = {}
+    errors = {}
+    for sheet, result in zip(sheets, results):
+        if result.status == "success":
+            outputs[sheet] = result.content.get("url")
+        else:
+            errors[sheet] = result.content
+    content = {
+        "sheets": outputs,
+        "duration": round(time.time() - start_time, 3),
+    }
+    if errors:
+        content["errors"] = errors
+    return BaseResponse(
+        status="error" if errors else "success",
+        content=content,
+        credits_used=sum(result.credits_used or 0 for result in results),
+        credits_remaining=min(
+            (r.credits_remaining for r in results if r.credits_remaining is not None),
+            default=None,
+        ),
+        tips="All sheets are already converted, no need to wait for them",
+    )
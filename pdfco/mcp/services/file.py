@@ -0,0 +1,50 @@
+import asyncio
+import hashlib
+
+from pdfco.mcp.services.client import PDFCoClient
+
+
+def file_sha256(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+async def hash_file(file_path: str) -> str:
+    """
+    Hash a local file's content without blocking the event loop
+    """
+    return await asyncio.to_thread(file_sha256, file_path)
+
+
+async def upload_local_file(file_path: str, api_key: str | None = None) -> dict:
+    """
+    Upload a local file to PDF.co Built-In Files Storage and return the API response
+    """
+    async with PDFCoClient(api_key=api_key) as client:
+        with open(file_path, "rb") as file:
+            response = await client.post(
+                "/v1/file/upload",
+                files={
+                    "file": file,
+                },
+            )
+        return response.json()
+
+
+async def upload_content(
+    file_name: str, content: bytes, api_key: str | None = None
+) -> dict:
+    """
+    Upload in-memory content to PDF.co Built-In Files Storage and return the API response
+    """
+    async with PDFCoClient(api_key=api_key) as client:
+        response = await client.post(
+            "/v1/file/upload",
+            files={
+                "file": (file_name, content),
+            },
+        )
+        return response.json()
@@ -0,0 +1,222 @@
+import asyncio
+import csv
+import io
+import time
+from typing import Any
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    gather_limited,
+    numbered_name,
+    skipped_response,
+)
+from pdfco.mcp.services.cache import PersistentCache
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.pdf import fill_pdf_form_fields, merge_pdf, request
+from pdfco.mcp.services.preflight import source_cache_entry, source_key
+from pdfco.mcp.services.result import find_records
+
+# pdf/info/fields results by source document
+_form_fields_cache = PersistentCache("form-fields", max_entries=512)
+
+
+async def read_form_fields_info(
+    params: ConversionParams, api_key: str | None = None, refresh: bool = False
+) -> BaseResponse:
+    """
+    Read the fillable fields of a PDF with a synchronous pdf/info/fields request.
+    Results are cached per source document and reused, without using credits,
+    until its content changes.
+    """
+    key, validator, max_age = await source_cache_entry(
+        params.url, params.httpusername, params.httppassword
+    )
+    if not refresh:
+        cached = await asyncio.to_thread(
+            _form_fields_cache.get, key, validator, max_age=max_age
+        )
+        if cached is not None:
+            return BaseResponse(status="success", content=cached, credits_used=0)
+
+    response = await request(
+        "pdf/info/fields", params, api_key=api_key, async_mode=False
+    )
+    if response.status != "success":
+        raise ValueError(f"Failed to read the form fields: {response.content}")
+    info = {"info": response.content.get("info")}
+    await asyncio.to_thread(_form_fields_cache.put, key, info, validator)
+    return BaseResponse(
+        status="success",
+        content=info,
+        credits_used=response.credits_used,
+        credits_remaining=response.credits_remaining,
+    )
+
+
+async def get_cached_form_fields(params: ConversionParams) -> dict[str, dict] | None:
+    """
+    Form fields of a PDF if they were read before, without submitting a request.
+    The source is only validated when an entry is cached.
+    """
+    if not await asyncio.to_thread(_form_fields_cache.contains, source_key(params.url)):
+        return None
+    key, validator, max_age = await source_cache_entry(
+        params.url, params.httpusername, params.httppassword
+    )
+    info = await asyncio.to_thread(
+        _form_fields_cache.get, key, validator, max_age=max_age
+    )
+    return form_field_map(info) if info is not None else None
+
+
+async def get_form_fields(
+    params: ConversionParams, api_key: str | None = None, refresh: bool = False
+) -> dict[str, dict]:
+    """
+    Fillable fields of a PDF keyed by field name
+    """
+    response = await read_form_fields_info(params, api_key, refresh)
+    return form_field_map(response.content)
+
+
+def form_field_map(info: dict) -> dict[str, dict]:
+    _, fields = find_records(info, "info.FieldsInfo.Fields")
+    return {field["FieldName"]: field for field in fields if "FieldName" in field}
+
+
+def unknown_field_names(fields: list[dict], form_fields: dict[str, dict]) -> list[str]:
+    return [
+        field["fieldName"]
+        for field in fields
+        if isinstance(field, dict)
+        and field.get("fieldName")
+        and field["fieldName"] not in form_fields
+    ]
+
+
+def parse_rows(rows: list[dict] | str) -> list[dict]:
+    """
+    Rows are either a list of objects or CSV text with a header row of field names
+    """
+    if isinstance(rows, str):
+        return list(csv.DictReader(io.StringIO(rows.strip())))
+    return rows
+
+
+def row_to_fields(row: dict[str, Any], form_fields: dict[str, dict]) -> list[dict]:
+    """
+    Convert a row into pdf/edit/add fields, raising for names that are not in the form
+    """
+    if None in row:
+        # csv.DictReader collects values beyond the header under a None key
+        raise ValueError(
+            f"Row has {len(row[None])} more values than the header has columns"
+        )
+    unknown = [name for name in row if name not in form_fields]
+    if unknown:
+        raise ValueError(f"Unknown form fields: {', '.join(unknown)}")
+    return [
+        {
+            "fieldName": name,
+            "pages": str(form_fields[name].get("PageIndex", 0)),
+            "text": str(value),
+        }
+        for name, value in row.items()
+        if value is not None
+    ]
+
+
+async def fill_forms_bulk(
+    params: ConversionParams,
+    rows: list[dict],
+    merge: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+) -> BaseResponse:
+    """
+    Fill the same form template once per row, validating rows against the
+    template's fields before submitting, and optionally merge the filled PDFs
+    """
+    start_time = time.time()
+    async with PDFCoClientPool(api_key=api_key):
+        form_fields = await get_form_fields(
+            ConversionParams(
+                url=params.url,
+                httpusername=params.httpusername,
+                httppassword=params.httppassword,
+            ),
+            api_key=api_key,
+        )
+
+        results: list[dict] = []
+        pending = []
+        for index, row in enumerate(rows):
+            try:
+                pending.append((index, row_to_fields(row, form_fields)))
+                results.append({"row": index, "status": "pending"})
+            except ValueError as e:
+                results.append({"row": index, "status": "invalid", "error": str(e)})
+
+        async def fill(item: tuple[int, list[dict]]) -> BaseResponse:
+            index, fields = item
+            row_params = params
+            if params.name:
+                row_params = params.model_copy(
+                    update={"name": numbered_name(params.name, index)}
+                )
+            return await complete_job(
+                await fill_pdf_form_fields(row_params, fields=fields, api_key=api_key),
+                api_key=api_key,
+            )
+
+        responses = await gather_limited(
+            fill, pending, concurrency, skipped=skipped_response
+        )
+        credits_used = 0
+        credits_remaining = None
+        for (index, _), response in zip(pending, responses):
+            credits_used += response.credits_used or 0
+            credits_remaining = response.credits_remaining or credits_remaining
+            if response.status == "success":
+                results[index] = {
+                    "row": index,
+                    "status": "success",
+                    "url": response.content["url"],
+                }
+            else:
+                results[index] = {
+                    "row": index,
+                    "status": "error",
+                    "error": response.content,
+                }
+
+        content = {
+            "results": results,
+            "succeeded": sum(result["status"] == "success" for result in results),
+            "failed": sum(result["status"] != "success" for result in results),
+        }
+        urls = [result["url"] for result in results if result["status"] == "success"]
+        if merge and urls:
+            merged = await complete_job(
+                await merge_pdf(
+                    ConversionParams(url=",".join(urls), name=params.name),
+                    api_key=api_key,
+                ),
+                api_key=api_key,
+            )
+            credits_used += merged.credits_used or 0
+            if merged.status == "success":
+                content["merged_url"] = merged.content["url"]
+            else:
+                content["merge_error"] = merged.content
+
+    content["duration"] = round(time.time() - start_time, 3)
+    return BaseResponse(
+        status="success" if content["failed"] == 0 else "error",
+        content=content,
+        credits_used=credits_used,
+        credits_remaining=credits_remaining,
+        tips="All fills are already complete, no need to wait for them",
+    )
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import os
+import time
+from typing import Awaitable, Callable
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    gather_limited,
+    skipped_response,
+)
+from pdfco.mcp.services.cache import PersistentCache
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.info import get_page_count
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.output import fetch_output
+from pdfco.mcp.services.pages import expand_page_ranges, format_page_indices
+from pdfco.mcp.services.pdf import convert_to
+from pdfco.mcp.services.preflight import source_cache_entry
+
+# Output links of PDF.co expire after 60 minutes, so cached image URLs are
+# dropped well before that
+IMAGE_URL_TTL = int(os.getenv("PDFCO_IMAGE_URL_TTL", str(50 * 60)))
+
+# Rendered page image URLs by (document, page, format)
+_page_images = PersistentCache("page-images", max_entries=8192, ttl=IMAGE_URL_TTL)
+
+
+async def render_page_images(
+    params: ConversionParams,
+    image_format: str,
+    chunk_size: int,
+    use_cache: bool = True,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+    on_page: Callable[[dict, int, int], Awaitable[None]] | None = None,
+) -> BaseResponse:
+    """
+    Render the requested pages as images with one job per chunk of `chunk_size`
+    pages, running the chunks concurrently. Each page is passed to `on_page`
+    with the number of pages delivered so far and in total as soon as it is
+    available, starting with the pages found in the cache.
+    """
+    start_time = time.time()
+    async with PDFCoClientPool(api_key=api_key):
+        key, validator, max_age = await source_cache_entry(
+            params.url, params.httpusername, params.httppassword
+        )
+        page_count = await get_page_count(params, api_key=api_key, verify=True)
+        indices = list(dict.fromkeys(expand_page_ranges(params.pages, page_count)))
+
+        def cache_key(page: int) -> str:
+            return json.dumps([key, page, image_format, params.rect])
+
+        images: dict[int, dict] = {}
+
+        async def deliver(page: int, url: str, cached: bool):
+            images[page] = {"page": page, "url": url, "cached": cached}
+            if on_page:
+                await on_page(images[page], len(images), len(indices))
+
+        if use_cache:
+            for page in indices:
+                url = await asyncio.to_thread(
+                    _page_images.get, cache_key(page), validator, max_age=max_age
+                )
+                if url:
+                    await deliver(page, url, True)
+
+        missing = [page for page in indices if page not in images]
+        size = max(chunk_size, 1)
+        chunks = [missing[i : i + size] for i in range(0, len(missing), size)]
+
+        async def render_chunk(chunk: list[int]) -> BaseResponse:
+            chunk_params = params.model_copy(
+                update={"pages": format_page_indices(chunk)}
+            )
+            result = await complete_job(
+                await convert_to("pdf", image_format, chunk_params, api_key=api_key),
+                api_key=api_key,
+            )
+            if result.status != "success":
+                return result
+            urls = await _image_urls(result.content)
+            for page, url in zip(chunk, urls):
+                await asyncio.to_thread(
+                    _page_images.put, cache_key(page), url, validator
+                )
+                await deliver(page, url, False)
+            return result
+
+        results = await gather_limited(
+            render_chunk, chunks, concurrency, skipped=skipped_response
+        )
+
+    credits_used = sum(result.credits_used or 0 for result in results)
+    credits_remaining = min(
+        (r.credits_remaining for r in results if r.credits_remaining is not None),
+        default=None,
+    )
+    errors = [
+        {"pages": format_page_indices(chunk), "error": result.content}
+        for chunk, result in zip(chunks, results)
+        if result.status != "success"
+    ]
+    content = {
+        "images": [images[page] for page in indices if page in images],
+        "page_count": page_count,
+        "chunks": len(chunks),
+        "cached": sum(image["cached"] for image in images.values()),
+        "duration": round(time.time() - start_time, 3),
+    }
+    if errors:
+        content["errors"] = errors
+    return BaseResponse(
+        status="error" if errors else "success",
+        content=content,
+        credits_used=credits_used,
+        credits_remaining=credits_remaining,
+        tips="All images are already rendered, no need to wait for them. Image links expire after 60 minutes",
+    )
+
+
+async def _image_urls(content: dict) -> list[str]:
+    """
+    Image URLs of a finished job in page order. Multi-page async jobs return a
+    link to a JSON array of the image URLs.
+    """
+    if content.get("urls"):
+        return list(content["urls"])
+    url = content.get("url")
+    if not url:
+        return []
+    if url.split("?", 1)[0].lower().endswith(".json"):
+        return list(json.loads(await fetch_output(url)))
+    return [url]
@@ -0,0 +1,143 @@
+import asyncio
+import os
+import time
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    SKIPPED_ERROR,
+    gather_limited,
+)
+from pdfco.mcp.services.cache import PersistentCache
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.pdf import get_pdf_info
+from pdfco.mcp.services.preflight import get_upload_preflight, source_cache_entry
+
+# How long document information is reused, in seconds
+INFO_CACHE_TTL = int(os.getenv("PDFCO_INFO_CACHE_TTL", str(7 * 24 * 60 * 60)))
+
+# pdf/info results by source document
+_pdf_info_cache = PersistentCache("pdf-info", max_entries=4096, ttl=INFO_CACHE_TTL)
+
+
+async def read_pdf_info(
+    params: ConversionParams, api_key: str | None = None, refresh: bool = False
+) -> tuple[dict, bool]:
+    """
+    Information of a PDF from a synchronous pdf/info request, cached per source
+    document. Returns the information and whether it came from the cache.
+    """
+    key, validator, max_age = await source_cache_entry(
+        params.url, params.httpusername, params.httppassword
+    )
+    if not refresh:
+        info = await asyncio.to_thread(
+            _pdf_info_cache.get, key, validator, max_age=max_age
+        )
+        if info is not None:
+            return info, True
+
+    response = await get_pdf_info(
+        ConversionParams(
+            url=params.url,
+            httpusername=params.httpusername,
+            httppassword=params.httppassword,
+            password=params.password,
+        ),
+        api_key=api_key,
+        async_mode=False,
+    )
+    if response.status != "success":
+        raise ValueError(f"Failed to read the document information: {response.content}")
+    info = response.content["info"]
+    await asyncio.to_thread(_pdf_info_cache.put, key, info, validator)
+    return info, False
+
+
+async def lookup_pdf_info(params: ConversionParams) -> dict | None:
+    """
+    Cached information of a PDF, without submitting a request
+    """
+    key, validator, max_age = await source_cache_entry(
+        params.url, params.httpusername, params.httppassword
+    )
+    return await asyncio.to_thread(_pdf_info_cache.get, key, validator, max_age=max_age)
+
+
+async def get_page_count(
+    params: ConversionParams, api_key: str | None = None, verify: bool = False
+) -> int:
+    """
+    Page count of the source document, from the pre-flight check of an uploaded
+    file if available, otherwise from its cached or newly read information.
+    With `verify`, the heuristic pre-flight count is skipped, for callers that
+    request pages by number and fail on pages past the end.
+    """
+    preflight = None if verify else get_upload_preflight(params.url)
+    if preflight and preflight.page_count:
+        return preflight.page_count
+
+    info, _ = await read_pdf_info(params, api_key=api_key)
+    return int(info["PageCount"])
+
+
+def select_fields(info: dict, fields: list[str]) -> dict:
+    if not fields:
+        return info
+    return {field: info.get(field) for field in fields}
+
+
+async def read_pdf_info_bulk(
+    urls: list[str],
+    params: ConversionParams,
+    fields: list[str] | None = None,
+    refresh: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+) -> BaseResponse:
+    """
+    Read the information of many PDFs concurrently, reusing cached results.
+    `fields` selects the information keys to return (e.g. PageCount, Encrypted,
+    Producer), all keys are returned if empty.
+    """
+    start_time = time.time()
+
+    async def read(url: str) -> dict:
+        document_start = time.time()
+        try:
+            info, cached = await read_pdf_info(
+                params.model_copy(update={"url": url}), api_key=api_key, refresh=refresh
+            )
+        except Exception as e:
+            return {"source": url, "status": "error", "error": str(e)}
+        return {
+            "source": url,
+            "status": "success",
+            "cached": cached,
+            "duration": round(time.time() - document_start, 3),
+            "info": select_fields(info, fields or []),
+        }
+
+    async with PDFCoClientPool(api_key=api_key):
+        documents = await gather_limited(
+            read,
+            urls,
+            concurrency,
+            skipped=lambda url: {
+                "source": url,
+                "status": "error",
+                "error": SKIPPED_ERROR,
+            },
+        )
+
+    failed = sum(document["status"] != "success" for document in documents)
+    return BaseResponse(
+        status="success" if failed == 0 else "error",
+        content={
+            "documents": documents,
+            "cached": sum(document.get("cached", False) for document in documents),
+            "failed": failed,
+            "duration": round(time.time() - start_time, 3),
+        },
+        tips="Use 'pdf_info_lookup' to read cached information without a new request",
+    )
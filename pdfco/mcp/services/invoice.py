@@ -0,0 +1,223 @@
+import asyncio
+import csv
+import io
+import json
+import time
+from typing import Any
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    SKIPPED_ERROR,
+    gather_limited,
+)
+from pdfco.mcp.services.cache import PersistentCache
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.file import upload_content
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.output import fetch_output
+from pdfco.mcp.services.pdf import parse_invoice
+from pdfco.mcp.services.preflight import content_hash
+
+# Formats of the table of parsed invoices
+TABLE_FORMATS = ("csv", "jsonl")
+
+# Parsed invoices by content hash of the source file
+_parsed_invoices = PersistentCache("invoices", max_entries=4096)
+
+
+async def parse_invoices_bulk(
+    urls: list[str],
+    table_format: str = "csv",
+    refresh: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+) -> BaseResponse:
+    """
+    Parse many invoices concurrently. Sources with the same content are parsed
+    once, and parsed invoices are cached by content hash across calls. The
+    parsed fields are flattened into one row per invoice and uploaded as a
+    CSV or JSONL table.
+    """
+    if table_format not in TABLE_FORMATS:
+        raise ValueError(
+            f"Unsupported table format '{table_format}', use one of: {', '.join(TABLE_FORMATS)}"
+        )
+
+    start_time = time.time()
+    async with PDFCoClientPool(api_key=api_key):
+        hashes = await gather_limited(
+            _safe_hash,
+            urls,
+            concurrency,
+            skipped=lambda url: TimeoutError(SKIPPED_ERROR),
+        )
+        first_source: dict[str, str] = {}
+        for url, digest in zip(urls, hashes):
+            if isinstance(digest, str) and digest not in first_source:
+                first_source[digest] = url
+
+        async def parse(item: tuple[str, str]) -> dict:
+            digest, url = item
+            parse_start = time.time()
+            if not refresh:
+                cached = await asyncio.to_thread(
+                    _parsed_invoices.get, f"sha256:{digest}"
+                )
+                if cached is not None:
+                    return {"data": cached, "cached": True, "credits_used": 0}
+            result = await complete_job(
+                await parse_invoice(ConversionParams(url=url), api_key=api_key),
+                api_key=api_key,
+            )
+            parsed = {
+                "cached": False,
+                "credits_used": result.credits_used or 0,
+                "credits_remaining": result.credits_remaining,
+                "latency": round(time.time() - parse_start, 3),
+            }
+            if result.status != "success":
+                return {**parsed, "error": result.content}
+            data = await _parsed_data(result.content)
+            await asyncio.to_thread(_parsed_invoices.put, f"sha256:{digest}", data)
+            return {**parsed, "data": data}
+
+        unique = list(first_source.items())
+        parsed = dict(
+            zip(
+                first_source,
+                await gather_limited(
+                    parse,
+                    unique,
+                    concurrency,
+                    skipped=lambda item: {
+                        "cached": False,
+                        "credits_used": 0,
+                        "error": SKIPPED_ERROR,
+                    },
+                ),
+            )
+        )
+
+        documents = []
+        rows = []
+        for url, digest in zip(urls, hashes):
+            if isinstance(digest, Exception):
+                documents.append(
+                    {
+                        "source": url,
+                        "status": "error",
+                        "error": f"Failed to read the source: {digest}",
+                    }
+                )
+                continue
+            document = {"source": url, "sha256": digest}
+            result = parsed[digest]
+            document["status"] = "error" if "error" in result else "success"
+            if first_source[digest] == url:
+                document.update(
+                    cached=result["cached"],
+                    latency=result.get("latency", 0),
+                    credits_used=result["credits_used"],
+                )
+            else:
+                document["duplicate_of"] = first_source[digest]
+            if "error" in result:
+                document["error"] = result["error"]
+            else:
+                rows.append({"source": url, **flatten_record(result["data"])})
+            documents.append(document)
+
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        table_url = None
+        if rows:
+            res = await upload_content(
+                f"invoices.{table_format}",
+                format_table(rows, columns, table_format),
+                api_key=api_key,
+            )
+            if res.get("status") != 200:
+                raise ValueError(f"Failed to upload the invoice table: {res}")
+            table_url = res["url"]
+
+    results = list(parsed.values())
+    failed = sum(document["status"] != "success" for document in documents)
+    return BaseResponse(
+        status="success" if failed == 0 else "error",
+        content={
+            "table_url": table_url,
+            "columns": columns,
+            "documents": documents,
+            "parsed": sum(
+                not result["cached"] and "error" not in result for result in results
+            ),
+            "cached": sum(result["cached"] for result in results),
+            "duplicates": sum("duplicate_of" in document for document in documents),
+            "failed": failed,
+            "duration": round(time.time() - start_time, 3),
+        },
+        credits_used=sum(result["credits_used"] for result in results),
+        credits_remaining=min(
+            (
+                result["credits_remaining"]
+                for result in results
+                if result.get("credits_remaining") is not None
+            ),
+            default=None,
+        ),
+        tips="All invoices are already parsed, no need to wait for them",
+    )
+
+
+async def _safe_hash(url: str) -> str | Exception:
+    try:
+        return await content_hash(url)
+    except Exception as e:
+        return e
+
+
+async def _parsed_data(content: dict) -> Any:
+    if "body" in content:
+        return content["body"]
+    if content.get("url"):
+        return json.loads(await fetch_output(content["url"]))
+    return content
+
+
+def flatten_record(data: Any, prefix: str = "") -> dict[str, Any]:
+    """
+    Flatten nested objects into dotted column names. Lists (e.g. line items)
+    are kept as JSON in a single column.
+    """
+    if not isinstance(data, dict):
+        return {prefix or "value": _cell(data)}
+    columns = {}
+    for key, value in data.items():
+        name = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            columns.update(flatten_record(value, name))
+        else:
+            columns[name] = _cell(value)
+    return columns
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, list):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def format_table(rows: list[dict], columns: list[str], table_format: str) -> bytes:
+    if table_format == "jsonl":
+        return "".join(
+            json.dumps(
+                {column: row.get(column) for column in columns}, ensure_ascii=False
+            )
+            + "\n"
+            for row in rows
+        ).encode("utf-8")
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
@@ -0,0 +1,202 @@
+import asyncio
+import os
+import sys
+from typing import Awaitable, Callable
+
+from pdfco.mcp.models import BaseResponse
+from pdfco.mcp.services.cache import LRUCache
+from pdfco.mcp.services.client import PDFCoClient
+from pdfco.mcp.services.deadline import deadline, time_left
+
+# Results of finished jobs, so their outputs can be served without another job check
+_finished_jobs = LRUCache(max_entries=1024)
+
+# Longest wait between checks of a job that reports its remaining time, in seconds
+MAX_POLL_INTERVAL = float(os.getenv("PDFCO_MAX_POLL_INTERVAL", "5"))
+
+# job/check documents only `duration` (seconds elapsed) of these keys. The
+# progress and remaining time keys are not documented; they are read when a
+# response carries them, and jobs without them are polled at the fixed interval.
+# Progress values are percent in 0..100.
+_PROGRESS_KEYS = ("progress", "percent", "percentage", "percentComplete")
+_REMAINING_KEYS = ("remainingTime", "remaining", "eta", "estimatedTimeLeft")
+_ELAPSED_KEYS = ("duration",)
+
+
+def _first_number(content: dict, keys: tuple[str, ...]) -> float | None:
+    for key in keys:
+        try:
+            return float(content[key])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def parse_job_progress(content: dict) -> tuple[float | None, float | None]:
+    """
+    Percent complete and remaining seconds of a working job from the hints of
+    its job/check response, None where the response has none. The remaining
+    time is extrapolated from the progress and elapsed time if not given.
+    """
+    if not isinstance(content, dict):
+        return None, None
+    percent = _first_number(content, _PROGRESS_KEYS)
+    if percent is not None:
+        percent = min(max(percent, 0), 100)
+    remaining = _first_number(content, _REMAINING_KEYS)
+    elapsed = _first_number(content, _ELAPSED_KEYS)
+    if remaining is None and percent and elapsed is not None:
+        remaining = elapsed * (100 - percent) / percent
+    return percent, remaining
+
+
+def next_poll_delay(interval: float, remaining: float | None) -> float:
+    """
+    Wait before the next check of a job: around its predicted finish when it
+    reports one, up to MAX_POLL_INTERVAL, otherwise `interval`
+    """
+    if remaining is None:
+        return interval
+    return min(max(remaining, interval), max(MAX_POLL_INTERVAL, interval))
+
+
+async def get_job_status(job_id: str, api_key: str = "") -> BaseResponse:
+    """
+    Check job status without MCP tool decoration
+    """
+    try:
+        async with PDFCoClient(api_key=api_key) as client:
+            response = await client.post(
+                "/v1/job/check",
+                json={
+                    "jobId": job_id,
+                },
+            )
+            json_data = response.json()
+            if json_data["status"] == "success":
+                _finished_jobs.put(job_id, json_data)
+            return BaseResponse(
+                status=json_data["status"],
+                content=json_data,
+                credits_used=json_data.get("credits"),
+                credits_remaining=json_data.get("remainingCredits"),
+                tips="You can download the result if status is success",
+            )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
+
+
+async def wait_for_job(
+    job_id: str,
+    api_key: str = "",
+    interval: float = 1,
+    timeout: float = 300,
+    on_progress: Callable[[float | None, float | None, dict], Awaitable[None]]
+    | None = None,
+) -> BaseResponse:
+    """
+    Poll a job until it succeeds, fails or the timeout expires. The next check
+    is scheduled near the finish predicted by the job's progress hints, or after
+    `interval` when there are none. `on_progress` receives the percent
+    complete, remaining seconds and response of each check of a working job.
+    The poll stops when the waiting task is cancelled, as it is when the
+    client cancels the tool call. A `timeout` of 0 or less checks the job once.
+    """
+    job_check_count = 0
+    credits_used = 0
+    credits_remaining = 0
+    # The poll stops at the timeout or at the deadline of the tool call if sooner
+    with deadline(timeout):
+        try:
+            while True:
+                response = await get_job_status(job_id, api_key=api_key)
+                job_check_count += 1
+                credits_used += response.credits_used or 0
+                credits_remaining = response.credits_remaining or 0
+                if response.status == "success":
+                    return BaseResponse(
+                        status="success",
+                        content=response.content,
+                        credits_used=credits_used,
+                        credits_remaining=credits_remaining,
+                        tips=f"Job check count: {job_check_count}. The output can also be read as the resource pdfco://jobs/{job_id}/output",
+                    )
+                elif response.status in ("failed", "aborted"):
+                    return BaseResponse(
+                        status="error",
+                        content=response.content,
+                        credits_used=credits_used,
+                        credits_remaining=credits_remaining,
+                    )
+                percent, remaining = parse_job_progress(response.content)
+                if on_progress:
+                    await on_progress(percent, remaining, response.content)
+                delay = next_poll_delay(interval, remaining)
+                left = time_left()
+                if left is not None:
+                    delay = max(min(delay, left), 0)
+                await asyncio.sleep(delay)
+                left = time_left()
+                # deadline() ignores a timeout of 0, which checks the job once
+                if timeout <= 0 or (left is not None and left <= 0):
+                    return BaseResponse(
+                        status="error",
+                        content="Job timed out",
+                        credits_used=credits_used,
+                        credits_remaining=credits_remaining,
+                        tips=f"Job check count: {job_check_count}",
+                    )
+        except asyncio.CancelledError:
+            print(
+                f"Stopped waiting for job {job_id} after {job_check_count} checks",
+                file=sys.stderr,
+            )
+            raise
+
+
+async def complete_job(
+    submission: BaseResponse,
+    api_key: str = "",
+    interval: float = 1,
+    timeout: float = 300,
+) -> BaseResponse:
+    """
+    Wait for a job submitted with services.pdf.request to finish. The credits of
+    the submission are included in the result.
+    """
+    if submission.status != "working":
+        return submission
+    content = submission.content
+    if content.get("error") or not content.get("jobId"):
+        return BaseResponse(
+            status="error",
+            content=content,
+            credits_used=submission.credits_used,
+            credits_remaining=submission.credits_remaining,
+        )
+    result = await wait_for_job(
+        content["jobId"], api_key=api_key, interval=interval, timeout=timeout
+    )
+    result.credits_used = (result.credits_used or 0) + (submission.credits_used or 0)
+    return result
+
+
+async def get_job_output_url(job_id: str, api_key: str = "") -> str:
+    """
+    Get the output URL of a finished job, checking the job only if its result
+    hasn't been seen yet
+    """
+    result = _finished_jobs.get(job_id)
+    if result is None:
+        response = await get_job_status(job_id, api_key=api_key)
+        if response.status != "success":
+            raise ValueError(f"Job {job_id} is not finished: {response.content}")
+        result = response.content
+
+    url = result.get("url") or next(iter(result.get("urls") or []), None)
+    if not url:
+        raise ValueError(f"Job {job_id} has no output file")
+    return url
@@ -0,0 +1,149 @@
+import math
+import os
+import time
+from typing import Awaitable, Callable
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    gather_limited,
+    skipped_response,
+)
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.pdf import merge_pdf
+
+# Default number of files merged by one pdf/merge2 job of a merge tree
+DEFAULT_FAN_IN = int(os.getenv("PDFCO_MERGE_FAN_IN", "20"))
+
+
+def plan_merge_tree(count: int, fan_in: int) -> list[int]:
+    """
+    Number of merge jobs at each level of a tree merging `count` files with at
+    most `fan_in` files per job. Above the first level, a single file left over
+    is carried to the next level without a job.
+    """
+    fan_in = max(fan_in, 2)
+    levels = []
+    while count > 1 or not levels:
+        jobs = math.ceil(count / fan_in)
+        carried = 1 if levels and count % fan_in == 1 else 0
+        levels.append(jobs - carried)
+        count = jobs
+    return levels
+
+
+async def merge_tree(
+    urls: list[str],
+    params: ConversionParams,
+    fan_in: int = DEFAULT_FAN_IN,
+    retries: int = 2,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+    on_progress: Callable[[int, int, str], Awaitable[None]] | None = None,
+) -> BaseResponse:
+    """
+    Merge many files with a tree of parallel partial merges of at most `fan_in`
+    files each, then merge the intermediate PDFs level by level. Failed merges
+    are retried on their own up to `retries` times, the rest of the level is
+    kept. `on_progress` receives the finished and total number of jobs.
+    """
+    if not urls:
+        raise ValueError("No files to merge")
+
+    start_time = time.time()
+    fan_in = max(fan_in, 2)
+    total = sum(plan_merge_tree(len(urls), fan_in))
+    finished = 0
+    credits_used = 0
+    credits_remaining = None
+    attempts = 0
+    levels = []
+
+    async def merge_group(item: tuple[int, list[str], bool]) -> BaseResponse:
+        nonlocal finished, credits_used, credits_remaining, attempts
+        depth, group, final = item
+        if len(group) == 1 and depth > 0:
+            return BaseResponse(status="success", content={"url": group[0]})
+        group_params = ConversionParams(
+            url=",".join(group),
+            name=params.name if final else "",
+            httpusername=params.httpusername if depth == 0 else "",
+            httppassword=params.httppassword if depth == 0 else "",
+        )
+        for _ in range(retries + 1):
+            attempts += 1
+            result = await complete_job(
+                await merge_pdf(group_params, api_key=api_key), api_key=api_key
+            )
+            credits_used += result.credits_used or 0
+            credits_remaining = result.credits_remaining or credits_remaining
+            if result.status == "success":
+                break
+        finished += 1
+        if on_progress:
+            await on_progress(
+                finished,
+                total,
+                f"Level {depth + 1}: merged {len(group)} files"
+                if result.status == "success"
+                else f"Level {depth + 1}: failed to merge {len(group)} files",
+            )
+        return result
+
+    level = list(urls)
+    async with PDFCoClientPool(api_key=api_key):
+        depth = 0
+        while len(level) > 1 or depth == 0:
+            groups = [level[i : i + fan_in] for i in range(0, len(level), fan_in)]
+            results = await gather_limited(
+                merge_group,
+                [(depth, group, len(groups) == 1) for group in groups],
+                concurrency,
+                skipped=skipped_response,
+            )
+            failed = [
+                {"files": group, "error": result.content}
+                for group, result in zip(groups, results)
+                if result.status != "success"
+            ]
+            levels.append(
+                {
+                    "files": len(level),
+                    "merges": sum(len(group) > 1 or depth == 0 for group in groups),
+                }
+            )
+            if failed:
+                partial = [
+                    result.content["url"]
+                    for result in results
+                    if result.status == "success"
+                ]
+                return BaseResponse(
+                    status="error",
+                    content={
+                        "level": depth + 1,
+                        "failed": failed,
+                        "partial": partial,
+                        "levels": levels,
+                    },
+                    credits_used=credits_used,
+                    credits_remaining=credits_remaining,
+                    tips="Some merges failed after retries, see the failed files",
+                )
+            level = [result.content["url"] for result in results]
+            depth += 1
+
+    return BaseResponse(
+        status="success",
+        content={
+            "url": level[0],
+            "files": len(urls),
+            "levels": levels,
+            "jobs": attempts,
+            "duration": round(time.time() - start_time, 3),
+        },
+        credits_used=credits_used,
+        credits_remaining=credits_remaining,
+        tips="The merge is already complete, no need to wait for it",
+    )
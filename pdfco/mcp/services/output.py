@@ -0,0 +1,105 @@
+import codecs
+import os
+from typing import Awaitable, Callable
+
+from httpx import AsyncClient
+
+from pdfco.mcp.services.cache import LRUCache
+
+# Outputs that can be returned inline as text
+_TEXT_CONTENT_TYPES = ("text/", "application/json", "application/xml")
+_TEXT_EXTENSIONS = (".txt", ".csv", ".json", ".xml", ".html", ".htm")
+
+# Downloaded output files, keyed by output URL
+_output_cache = LRUCache(
+    max_entries=int(os.getenv("PDFCO_OUTPUT_CACHE_MAX_ENTRIES", "128")),
+    max_size=int(os.getenv("PDFCO_OUTPUT_CACHE_MAX_BYTES", str(256 * 1024 * 1024))),
+)
+
+
+async def fetch_output(url: str, use_cache: bool = True) -> bytes:
+    """
+    Download a job output file. Output links point to PDF.co's temporary file
+    storage, so the API key is not sent along.
+    """
+    if use_cache and url in _output_cache:
+        return _output_cache.get(url)
+
+    async with AsyncClient(follow_redirects=True) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        if use_cache:
+            _output_cache.put(url, response.content)
+        return response.content
+
+
+async def fetch_output_range(url: str, start: int, end: int | None = None) -> bytes:
+    """
+    Read the bytes start..end (inclusive) of a job output file. Served from the
+    cache when the whole file was downloaded before, otherwise with a range request.
+    """
+    if url in _output_cache:
+        content = _output_cache.get(url)
+        return content[start : None if end is None else end + 1]
+
+    async with AsyncClient(follow_redirects=True) as client:
+        response = await client.get(
+            url, headers={"Range": f"bytes={start}-{'' if end is None else end}"}
+        )
+        response.raise_for_status()
+        if response.status_code == 206:
+            return response.content
+        return response.content[start : None if end is None else end + 1]
+
+
+def is_text_output(url: str) -> bool:
+    return url.split("?", 1)[0].lower().endswith(_TEXT_EXTENSIONS)
+
+
+async def stream_text_output(
+    url: str,
+    max_bytes: int = 1_000_000,
+    encoding: str = "",
+    on_progress: Callable[[int, int | None], Awaitable[None]] | None = None,
+) -> tuple[str, int, bool]:
+    """
+    Stream a text output file (text, CSV, JSON, XML) and decode it incrementally.
+    After each chunk, on_progress receives the bytes received so far and the
+    total size if known. Stops after max_bytes.
+    Returns the decoded text, the number of bytes read and whether it was truncated.
+    """
+    async with AsyncClient(follow_redirects=True) as client:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("content-type", "")
+            is_text = content_type.startswith(_TEXT_CONTENT_TYPES) or (
+                response.url.path.lower().endswith(_TEXT_EXTENSIONS)
+            )
+            if not encoding and not is_text:
+                raise ValueError(
+                    f"Output is not a text file ({content_type}), use the url to download it"
+                )
+
+            charset = encoding or response.charset_encoding or "utf-8"
+            if codecs.lookup(charset).name == "utf-8":
+                charset = "utf-8-sig"
+            decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+            total = int(response.headers.get("content-length", 0)) or None
+
+            parts = []
+            received = 0
+            truncated = False
+            async for chunk in response.aiter_bytes():
+                if received + len(chunk) > max_bytes:
+                    chunk = chunk[: max_bytes - received]
+                    truncated = True
+                received += len(chunk)
+                text = decoder.decode(chunk)
+                parts.append(text)
+                if on_progress:
+                    await on_progress(received, total)
+                if truncated:
+                    break
+            if not truncated:
+                parts.append(decoder.decode(b"", final=True))
+            return "".join(parts), received, truncated
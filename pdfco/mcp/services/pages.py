@@ -0,0 +1,89 @@
+def parse_page_ranges(
+    pages: str, page_count: int | None = None
+) -> list[tuple[int, int | None]]:
+    """
+    Parse a PDF.co page selection (e.g. '0, 1, 2-' or '1, 3-7' or '!0') into
+    (start, end) index pairs. Open-ended ranges have an end of None unless the
+    page count is known. Inverted indices ('!N') require the page count.
+    """
+    ranges = []
+    for token in pages.replace(" ", "").split(","):
+        if not token:
+            continue
+        if token == "*":
+            ranges.append((0, page_count - 1 if page_count else None))
+            continue
+        start, sep, end = token.partition("-")
+        first = _parse_index(start, page_count) if start else 0
+        if not sep:
+            last = first
+        elif end:
+            last = _parse_index(end, page_count)
+        else:
+            last = page_count - 1 if page_count else None
+        ranges.append((first, last))
+    return ranges
+
+
+def expand_page_ranges(pages: str, page_count: int) -> list[int]:
+    """
+    Expand a PDF.co page selection into the ordered list of page indices.
+    An empty selection means all pages.
+    """
+    if not pages.strip():
+        return list(range(page_count))
+    indices = []
+    for first, last in parse_page_ranges(pages, page_count):
+        last = page_count - 1 if last is None else min(last, page_count - 1)
+        indices.extend(range(first, last + 1))
+    return indices
+
+
+def page_in_ranges(page: int, ranges: list[tuple[int, int | None]]) -> bool:
+    return any(
+        first <= page and (last is None or page <= last) for first, last in ranges
+    )
+
+
+def _parse_index(value: str, page_count: int | None) -> int:
+    if value.startswith("!"):
+        if page_count is None:
+            raise ValueError(f"Inverted page index '{value}' requires the page count")
+        return page_count - 1 - int(value[1:])
+    return int(value)
+
+
+def chunk_page_indices(indices: list[int], size: int) -> list[str]:
+    """
+    Split page indices into chunks of at most `size` pages, each formatted as a
+    PDF.co page selection (e.g. '0-49' or '0-9,20-29')
+    """
+    return [
+        format_page_indices(indices[i : i + size]) for i in range(0, len(indices), size)
+    ]
+
+
+def chunk_contiguous_pages(indices: list[int], size: int) -> list[list[int]]:
+    """
+    Split page indices into chunks of at most `size` consecutive pages, starting
+    a new chunk wherever the indices are not consecutive
+    """
+    chunks: list[list[int]] = []
+    for index in indices:
+        if chunks and len(chunks[-1]) < size and index == chunks[-1][-1] + 1:
+            chunks[-1].append(index)
+        else:
+            chunks.append([index])
+    return chunks
+
+
+def format_page_indices(indices: list[int]) -> str:
+    runs = []
+    for index in indices:
+        if runs and index == runs[-1][1] + 1:
+            runs[-1][1] = index
+        else:
+            runs.append([index, index])
+    return ",".join(
+        str(first) if first == last else f"{first}-{last}" for first, last in runs
+    )
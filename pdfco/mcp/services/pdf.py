@@ -1,6 +1,38 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
 import sys
+import time
+from typing import Any
+
 from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.cache import LRUCache
 from pdfco.mcp.services.client import PDFCoClient
+from pdfco.mcp.services.deadline import check_deadline
+from pdfco.mcp.services.file import upload_content
+
+# Longer payload strings are truncated in the request log
+_MAX_LOGGED_CHARS = 200
+
+# Request bodies with inline html larger than this are uploaded as a file and
+# converted from its URL instead
+MAX_INLINE_BYTES = int(os.getenv("PDFCO_MAX_INLINE_BYTES", str(1024 * 1024)))
+
+# Opt-in gzip compression of request bodies of at least COMPRESS_MIN_BYTES
+COMPRESS_REQUESTS = os.getenv("PDFCO_COMPRESS_REQUESTS", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+COMPRESS_MIN_BYTES = int(os.getenv("PDFCO_COMPRESS_MIN_BYTES", str(64 * 1024)))
+
+# How long uploaded html is reused, below the expiry of PDF.co temporary files
+OFFLOADED_HTML_TTL = 50 * 60
+
+# Uploads of offloaded html by API key and content hash, with their start time
+_offloaded_html = LRUCache(max_entries=64)
 
 
 async def convert_to(
@@ -94,8 +126,10 @@ async def make_pdf_unsearchable(
     return await request("pdf/makeunsearchable", params, api_key=api_key)
 
 
-async def get_pdf_info(params: ConversionParams, api_key: str | None = None) -> BaseResponse:
-    return await request("pdf/info", params, api_key=api_key)
+async def get_pdf_info(
+    params: ConversionParams, api_key: str | None = None, async_mode: bool = True
+) -> BaseResponse:
+    return await request("pdf/info", params, api_key=api_key, async_mode=async_mode)
 
 
 async def add_pdf_password(
@@ -127,18 +161,40 @@ async def request(
     params: ConversionParams,
     custom_payload: dict | None = None,
     api_key: str | None = None,
+    async_mode: bool = True,
 ) -> BaseResponse:
-    payload = params.parse_payload(async_mode=True)
+    payload = params.parse_payload(async_mode=async_mode, endpoint=endpoint)
     if custom_payload:
         payload.update(custom_payload)
 
     try:
+        # Don't submit new jobs for a tool call that has run out of time
+        check_deadline()
         async with PDFCoClient(api_key=api_key) as client:
+            body = _encode(payload)
+            if len(body) > MAX_INLINE_BYTES and _can_offload(endpoint, payload):
+                endpoint, payload = await _offload_html(payload, api_key)
+                body = _encode(payload)
+
             url = f"/v1/{endpoint}"
-            print(f"Requesting {url} with payload {payload}", file=sys.stderr)
-            response = await client.post(url, json=payload)
+            headers = {"Content-Type": "application/json"}
+            if COMPRESS_REQUESTS and len(body) >= COMPRESS_MIN_BYTES:
+                body = gzip.compress(body, compresslevel=6)
+                headers["Content-Encoding"] = "gzip"
+            print(
+                f"Requesting {url} ({len(body)} bytes) with payload {_loggable(payload)}",
+                file=sys.stderr,
+            )
+            response = await client.post(url, content=body, headers=headers)
             print(f"response: {response}", file=sys.stderr)
             json_data = response.json()
+            if not async_mode:
+                return BaseResponse(
+                    status="error" if json_data.get("error") else "success",
+                    content=json_data,
+                    credits_used=json_data.get("credits"),
+                    credits_remaining=json_data.get("remainingCredits"),
+                )
             return BaseResponse(
                 status="working",
                 content=json_data,
@@ -151,3 +207,74 @@ async def request(
             status="error",
             content=f"{type(e)}: {[arg for arg in e.args if arg]}",
         )
+
+
+def _encode(payload: dict) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def _can_offload(endpoint: str, payload: dict) -> bool:
+    # Templates are rendered from templateData by the html endpoint only
+    return (
+        endpoint == "pdf/convert/from/html"
+        and bool(payload.get("html"))
+        and not payload.get("templateId")
+        and not payload.get("templateData")
+    )
+
+
+async def _offload_html(payload: dict, api_key: str | None) -> tuple[str, dict]:
+    """
+    Upload oversized inline html and switch the request to pdf/convert/from/url,
+    which takes the same rendering options. The same html is uploaded once and
+    its URL reused, also by concurrent requests of a batch.
+    """
+    payload = dict(payload)
+    html = payload.pop("html").encode("utf-8")
+    key = (api_key or "", hashlib.sha256(html).hexdigest())
+    entry = _offloaded_html.get(key)
+    if entry is None or time.time() - entry[1] > OFFLOADED_HTML_TTL:
+        name = payload.get("name", "")
+        stem = name.rpartition(".")[0] or name or "document"
+        entry = (
+            asyncio.ensure_future(_upload_html(f"{stem}.html", html, api_key)),
+            time.time(),
+        )
+        _offloaded_html.put(key, entry)
+    try:
+        # A cancelled request must not cancel the upload shared with others
+        payload["url"] = await asyncio.shield(entry[0])
+    except Exception:
+        if _offloaded_html.get(key) is entry:
+            _offloaded_html.pop(key)
+        raise
+    return "pdf/convert/from/url", payload
+
+
+async def _upload_html(name: str, html: bytes, api_key: str | None) -> str:
+    res = await upload_content(name, html, api_key=api_key)
+    if res.get("status") != 200:
+        raise ValueError(f"Failed to upload the inline html: {res}")
+    return res["url"]
+
+
+def _loggable(value: Any) -> Any:
+    """
+    Copy of a payload that is safe to log, with passwords (ownerPassword,
+    userPassword, httppassword, ...) redacted and long strings (e.g. inline
+    html templates) truncated
+    """
+    if isinstance(value, dict):
+        return {
+            key: "***"
+            if "password" in str(key).lower() and value[key]
+            else _loggable(value[key])
+            for key in value
+        }
+    if isinstance(value, list):
+        return [_loggable(item) for item in value]
+    if isinstance(value, str) and len(value) > _MAX_LOGGED_CHARS:
+        return f"{value[:_MAX_LOGGED_CHARS]}... ({len(value)} chars)"
+    return value
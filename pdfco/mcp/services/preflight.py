@@ -0,0 +1,277 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import re
+import zlib
+
+from httpx import AsyncClient
+
+from pdfco.mcp.models import PreflightInfo
+from pdfco.mcp.services.cache import LRUCache
+from pdfco.mcp.services.file import file_sha256
+from pdfco.mcp.services.output import fetch_output
+
+# Upper bound of stream data decompressed while inspecting one file
+_MAX_INFLATED_BYTES = 64 * 1024 * 1024
+
+_OBJECT_RE = re.compile(rb"(\d+)\s+\d+\s+obj\b(.*?)\bendobj", re.S)
+_PAGE_RE = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+# Text showing operators (Tj, TJ, ' and ") inside a BT ... ET block
+_TEXT_OPERATOR_RE = re.compile(rb"\bBT\b.*?(?:\bT[jJ]|['\"])(?=[\s\]<(/]|$)", re.S)
+_PAGES_RE = re.compile(rb"/Type\s*/Pages\b")
+_KIDS_RE = re.compile(rb"/Kids\s*\[([^\]]*)\]")
+_CONTENTS_RE = re.compile(rb"/Contents\s*(\[[^\]]*\]|\d+\s+\d+\s+R)")
+_REF_RE = re.compile(rb"(\d+)\s+\d+\s+R")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+_FIRST_RE = re.compile(rb"/First\s+(\d+)")
+
+# Maximum age of cached results for sources that can't be validated
+UNVALIDATED_MAX_AGE = 24 * 60 * 60
+
+# Preflight results by content hash, and by PDF.co URL for uploaded files
+_preflight_by_hash = LRUCache(max_entries=4096)
+_preflight_by_url = LRUCache(max_entries=4096)
+
+
+async def preflight_file(file_path: str, sha256: str | None = None) -> PreflightInfo:
+    """
+    Inspect a local file without submitting a job, reusing earlier results for
+    files with the same content
+    """
+    if sha256 is None:
+        sha256 = await asyncio.to_thread(file_sha256, file_path)
+    info = _preflight_by_hash.get(sha256)
+    if info is None:
+        info = await asyncio.to_thread(inspect_file, file_path, sha256)
+        _preflight_by_hash.put(sha256, info)
+    return info
+
+
+def remember_upload(url: str, info: PreflightInfo):
+    _preflight_by_url.put(url, info)
+
+
+def get_upload_preflight(url: str) -> PreflightInfo | None:
+    """
+    Preflight result of a file uploaded through this server, if any
+    """
+    return _preflight_by_url.get(url)
+
+
+async def source_identity(
+    url: str, httpusername: str = "", httppassword: str = ""
+) -> tuple[str, str | None]:
+    """
+    Cache key and validator for a source document. Files uploaded through this
+    server are keyed by content hash; other URLs are keyed by URL and validated
+    with the ETag, Last-Modified and Content-Length of a HEAD request, so cached
+    results are invalidated when the content changes.
+    """
+    key = source_key(url)
+    if key.startswith("sha256:"):
+        return key, None
+
+    try:
+        async with AsyncClient(follow_redirects=True) as client:
+            response = await client.head(
+                url, auth=(httpusername, httppassword) if httpusername else None
+            )
+        headers = response.headers
+        parts = [
+            headers.get(name, "")
+            for name in ("etag", "last-modified", "content-length")
+        ]
+        validator = "|".join(parts) if response.is_success and any(parts) else None
+    except Exception:
+        validator = None
+    return key, validator
+
+
+def source_key(url: str) -> str:
+    """
+    Cache key of a source document, without validating it
+    """
+    preflight = get_upload_preflight(url)
+    return f"sha256:{preflight.sha256}" if preflight else f"url:{url}"
+
+
+async def content_hash(url: str) -> str:
+    """
+    SHA-256 of a source file, known for files uploaded through this server and
+    downloaded otherwise
+    """
+    preflight = get_upload_preflight(url)
+    if preflight:
+        return preflight.sha256
+    return hashlib.sha256(await fetch_output(url, use_cache=False)).hexdigest()
+
+
+async def source_cache_entry(
+    url: str, httpusername: str = "", httppassword: str = ""
+) -> tuple[str, str | None, float | None]:
+    """
+    Cache key, validator and maximum age of results for a source document.
+    Results for URLs that can't be validated expire after UNVALIDATED_MAX_AGE.
+    """
+    key, validator = await source_identity(url, httpusername, httppassword)
+    max_age = UNVALIDATED_MAX_AGE if key.startswith("url:") and not validator else None
+    return key, validator, max_age
+
+
+def inspect_file(file_path: str, sha256: str) -> PreflightInfo:
+    """
+    Fast heuristic inspection of a PDF: page count, encryption and text layer.
+    Values that can't be determined are left as None.
+    """
+    file_size = os.path.getsize(file_path)
+    if file_size == 0:
+        return PreflightInfo(sha256=sha256, file_size=0, is_pdf=False)
+
+    with (
+        open(file_path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        if data.find(b"%PDF-", 0, 1024) < 0:
+            return PreflightInfo(sha256=sha256, file_size=file_size, is_pdf=False)
+
+        encrypted = data.rfind(b"/Encrypt") >= 0
+        heads: dict[int, bytes] = {}
+        # Offsets of the stream data of each object, read from the file when needed
+        streams: dict[int, tuple[int, int]] = {}
+        complete = True
+        inflated = 0
+        for match in _OBJECT_RE.finditer(data):
+            number = int(match.group(1))
+            start, end = match.span(2)
+            stream_at = data.find(b"stream", start, end)
+            # Later definitions, like those of incremental updates, replace earlier ones
+            heads[number] = data[start : end if stream_at < 0 else stream_at]
+            streams.pop(number, None)
+            if stream_at < 0:
+                continue
+            streams[number] = (stream_at + len(b"stream"), end)
+            if b"/ObjStm" in heads[number]:
+                if encrypted or inflated > _MAX_INFLATED_BYTES:
+                    complete = False
+                    continue
+                content = _inflate(
+                    data[stream_at + len(b"stream") : end], heads[number]
+                )
+                inflated += len(content)
+                heads.update(_compressed_objects(content, heads[number]))
+
+        # Left unknown when the page tree can't be read, so pdf/info is asked instead
+        pages = _page_tree(heads) if complete else None
+        text_pages = None
+        if pages and not encrypted:
+            text_pages = _text_pages(data, heads, streams, pages)
+        has_text_layer = None
+        if text_pages is not None:
+            has_text_layer = len(text_pages) == len(pages)
+        return PreflightInfo(
+            sha256=sha256,
+            file_size=file_size,
+            is_pdf=True,
+            page_count=len(pages) if pages else None,
+            encrypted=encrypted,
+            has_text_layer=has_text_layer,
+            text_pages=text_pages,
+        )
+
+
+def _compressed_objects(content: bytes, head: bytes) -> dict[int, bytes]:
+    """
+    Objects stored in an object stream, by object number
+    """
+    first = _FIRST_RE.search(head)
+    if not first:
+        return {}
+    first = int(first.group(1))
+    try:
+        numbers = [int(value) for value in content[:first].split()]
+    except ValueError:
+        return {}
+    pairs = list(zip(numbers[::2], numbers[1::2]))
+    offsets = [first + offset for _, offset in pairs] + [len(content)]
+    return {
+        number: content[offsets[index] : offsets[index + 1]]
+        for index, (number, _) in enumerate(pairs)
+    }
+
+
+def _page_tree(heads: dict[int, bytes]) -> list[int] | None:
+    """
+    Object numbers of the pages in page tree order. None if the tree can't be
+    followed or doesn't match the /Count of its root.
+    """
+    kids = {
+        number: [int(ref) for ref in _REF_RE.findall(match.group(1))]
+        for number, head in heads.items()
+        if _PAGES_RE.search(head) and (match := _KIDS_RE.search(head))
+    }
+    children = {kid for refs in kids.values() for kid in refs}
+    roots = [number for number in kids if number not in children]
+    if len(roots) != 1:
+        return None
+
+    ordered = []
+    stack = [roots[0]]
+    visited = set()
+    while stack:
+        number = stack.pop()
+        if number in visited:
+            return None
+        visited.add(number)
+        if number in kids:
+            stack.extend(reversed(kids[number]))
+        elif _PAGE_RE.search(heads.get(number, b"")):
+            ordered.append(number)
+        else:
+            return None
+    count = _COUNT_RE.search(heads[roots[0]])
+    if count and int(count.group(1)) != len(ordered):
+        return None
+    return ordered
+
+
+def _text_pages(
+    data: mmap.mmap,
+    heads: dict[int, bytes],
+    streams: dict[int, tuple[int, int]],
+    pages: list[int],
+) -> list[int]:
+    """
+    Indices of the pages whose content streams show text. Text drawn only from
+    form XObjects is not seen, so such pages count as having no text layer.
+    """
+    text_pages = []
+    inflated = 0
+    for index, number in enumerate(pages):
+        match = _CONTENTS_RE.search(heads[number])
+        refs = _REF_RE.findall(match.group(1)) if match else []
+        for ref in refs:
+            if int(ref) not in streams or inflated > _MAX_INFLATED_BYTES:
+                continue
+            start, end = streams[int(ref)]
+            content = _inflate(data[start:end], heads[int(ref)])
+            inflated += len(content)
+            if _TEXT_OPERATOR_RE.search(content):
+                text_pages.append(index)
+                break
+    return text_pages
+
+
+def _inflate(stream: bytes, head: bytes) -> bytes:
+    stream = stream.lstrip(b"\r\n")
+    end = stream.rfind(b"endstream")
+    if end >= 0:
+        stream = stream[:end]
+    if b"/Filter" not in head:
+        return stream
+    if b"/FlateDecode" not in head:
+        return b""
+    try:
+        return zlib.decompressobj().decompress(stream, _MAX_INFLATED_BYTES)
+    except zlib.error:
+        return b""
@@ -0,0 +1,85 @@
+import json
+import time
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    gather_limited,
+    numbered_name,
+    skipped_response,
+)
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.pdf import convert_from
+
+
+async def render_html_bulk(
+    params: ConversionParams,
+    records: list[dict],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+) -> BaseResponse:
+    """
+    Render one PDF per record, with PDF.co filling the template from the record
+    sent as templateData. With a templateId only the record is sent with each
+    job; an inline html template is sent along with every record. Outputs are
+    returned in record order with throughput stats.
+    """
+    if not params.templateId and not params.html:
+        raise ValueError("Either templateId or html is required")
+
+    start_time = time.time()
+
+    async def render(item: tuple[int, dict]) -> tuple[BaseResponse, float]:
+        index, record = item
+        record_start = time.time()
+        update = {"templateData": json.dumps(record, ensure_ascii=False)}
+        if params.name:
+            update["name"] = numbered_name(params.name, index)
+        response = await complete_job(
+            await convert_from(
+                "pdf", "html", params.model_copy(update=update), api_key=api_key
+            ),
+            api_key=api_key,
+        )
+        return response, round(time.time() - record_start, 3)
+
+    async with PDFCoClientPool(api_key=api_key):
+        responses = await gather_limited(
+            render,
+            enumerate(records),
+            concurrency,
+            skipped=lambda item: (skipped_response(), 0.0),
+        )
+
+    results = []
+    credits_used = 0
+    credits_remaining = None
+    for index, (response, duration) in enumerate(responses):
+        credits_used += response.credits_used or 0
+        credits_remaining = response.credits_remaining or credits_remaining
+        result = {"record": index, "status": response.status, "duration": duration}
+        if response.status == "success":
+            result["url"] = response.content["url"]
+        else:
+            result["error"] = response.content
+        results.append(result)
+
+    duration = time.time() - start_time
+    failed = sum(result["status"] != "success" for result in results)
+    return BaseResponse(
+        status="success" if failed == 0 else "error",
+        content={
+            "results": results,
+            "urls": [result.get("url") for result in results],
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "duration": round(duration, 3),
+            "documents_per_second": round(len(results) / duration, 2)
+            if duration
+            else None,
+        },
+        credits_used=credits_used,
+        credits_remaining=credits_remaining,
+        tips="All documents are already rendered, no need to wait for them",
+    )
@@ -0,0 +1,120 @@
+import json
+from typing import Any
+
+from pdfco.mcp.services.pages import page_in_ranges, parse_page_ranges
+
+# Keys holding the page index of a record in PDF.co JSON outputs
+_PAGE_KEYS = ("pageIndex", "PageIndex", "@index", "page")
+
+
+def find_records(data: Any, path: str = "") -> tuple[str, list]:
+    """
+    Locate the list of records in a JSON output. Uses the dotted path if given,
+    otherwise the largest list found in the document (e.g. 'document.page' for
+    pdf_to_json or 'info.FieldsInfo.Fields' for read_pdf_forms_info).
+    """
+    if path:
+        node = data
+        for key in path.split("."):
+            node = node[int(key)] if isinstance(node, list) else node[key]
+        return path, node if isinstance(node, list) else [node]
+
+    best_path, best = "", data if isinstance(data, list) else [data]
+    queue = [("", data)]
+    while queue:
+        node_path, node = queue.pop(0)
+        if not isinstance(node, dict):
+            continue
+        for key, value in node.items():
+            child_path = f"{node_path}.{key}" if node_path else key
+            if isinstance(value, list) and len(value) > len(best):
+                best_path, best = child_path, value
+            elif isinstance(value, dict):
+                queue.append((child_path, value))
+    return best_path, best
+
+
+def record_page(record: Any) -> int | None:
+    if isinstance(record, dict):
+        for key in _PAGE_KEYS:
+            if key in record:
+                try:
+                    return int(record[key])
+                except (TypeError, ValueError):
+                    return None
+    return None
+
+
+def shape_records(
+    records: list,
+    fields: str = "",
+    pages: str = "",
+    cursor: str = "",
+    limit: int = 50,
+    max_chars: int = 20000,
+) -> dict:
+    """
+    Apply a page window, field projection, pagination cursor and size cap to a
+    list of records. Every page but the last returns at least one record, so
+    following 'next_cursor' always ends.
+    """
+    if limit < 1:
+        raise ValueError(f"Invalid limit {limit}, use at least 1 record")
+    if pages.strip():
+        ranges = parse_page_ranges(pages)
+        records = [
+            record
+            for record in records
+            if (page := record_page(record)) is not None
+            and page_in_ranges(page, ranges)
+        ]
+
+    keys = [key.strip() for key in fields.split(",") if key.strip()]
+    offset = int(cursor) if cursor else 0
+    if offset < 0:
+        raise ValueError(f"Invalid cursor '{cursor}', use a 'next_cursor' value")
+    items = []
+    size = 0
+    truncated = False
+    position = offset
+    for record in records[offset : offset + limit]:
+        if keys and isinstance(record, dict):
+            record = {key: record[key] for key in keys if key in record}
+        serialized = json.dumps(record, ensure_ascii=False)
+        if items and size + len(serialized) > max_chars:
+            break
+        if len(serialized) > max_chars:
+            record = truncate_record(record, max_chars)
+            serialized = json.dumps(record, ensure_ascii=False)
+            truncated = True
+        items.append(record)
+        size += len(serialized)
+        position += 1
+
+    return {
+        "total": len(records),
+        "cursor": str(offset),
+        "next_cursor": str(position) if position < len(records) else None,
+        "truncated": truncated,
+        "items": items,
+    }
+
+
+def truncate_record(record: Any, max_chars: int) -> dict:
+    """
+    Shrink an oversized record while keeping it an object: each value longer
+    than its share of max_chars is replaced by the start of its JSON, and
+    '_truncated' marks the record
+    """
+    if not isinstance(record, dict):
+        return {
+            "value": json.dumps(record, ensure_ascii=False)[:max_chars],
+            "_truncated": True,
+        }
+    share = max(max_chars // max(len(record), 1), 1)
+    shrunk = {}
+    for key, value in record.items():
+        serialized = json.dumps(value, ensure_ascii=False)
+        shrunk[key] = value if len(serialized) <= share else serialized[:share]
+    shrunk["_truncated"] = True
+    return shrunk
@@ -0,0 +1,391 @@
+import asyncio
+import json
+import os
+import re
+import time
+from collections import deque
+from typing import Any, Iterator
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.cache import LRUCache, PersistentCache
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.output import fetch_output
+from pdfco.mcp.services.pages import page_in_ranges, parse_page_ranges
+from pdfco.mcp.services.pdf import convert_to, find_table_in_pdf
+from pdfco.mcp.services.preflight import source_cache_entry
+from pdfco.mcp.services.result import record_page
+
+INDEX_MAX_ENTRIES = int(os.getenv("PDFCO_INDEX_MAX_ENTRIES", "256"))
+
+# Text and table indexes by source document, on disk and recently used in memory
+_index_cache = PersistentCache("document-index", max_entries=INDEX_MAX_ENTRIES)
+_loaded_indexes = LRUCache(max_entries=16)
+
+
+async def get_document_index(
+    params: ConversionParams, api_key: str | None = None, refresh: bool = False
+) -> tuple[dict, int]:
+    """
+    Index of a whole document: its text lines with word coordinates and page
+    sizes, built from one pdf/convert/to/json2 job. Table regions are added on
+    first use by 'get_indexed_tables'. Indexes are kept on disk per source
+    document until its content changes. Returns the index and the credits used.
+    """
+    key, validator, max_age = await source_cache_entry(
+        params.url, params.httpusername, params.httppassword
+    )
+    if not refresh:
+        index = _loaded_indexes.get((key, validator))
+        if index is None or (
+            max_age is not None and time.time() - index["built_at"] > max_age
+        ):
+            index = await asyncio.to_thread(
+                _index_cache.get, key, validator, max_age=max_age
+            )
+        if index is not None:
+            _loaded_indexes.put((key, validator), index)
+            return index, 0
+
+    response = await complete_job(
+        await convert_to(
+            "pdf", "json2", params.model_copy(update={"pages": ""}), api_key=api_key
+        ),
+        api_key=api_key,
+    )
+    if response.status != "success":
+        raise ValueError(f"Failed to extract the text: {response.content}")
+    document = json.loads(await fetch_output(response.content["url"]))
+    index = {
+        "built_at": time.time(),
+        "pages": parse_json2_pages(document),
+        "lines": parse_json2_lines(document),
+        "tables": None,
+    }
+    await _save_index(key, validator, index)
+    return index, response.credits_used or 0
+
+
+async def get_indexed_tables(
+    params: ConversionParams, api_key: str | None = None, refresh: bool = False
+) -> tuple[list[dict], int]:
+    """
+    Table regions of the requested pages from the document index, running one
+    pdf/find/table job over the whole document the first time
+    """
+    index, credits_used = await get_document_index(params, api_key, refresh)
+    if index["tables"] is None:
+        response = await complete_job(
+            await find_table_in_pdf(
+                params.model_copy(update={"pages": ""}), api_key=api_key
+            ),
+            api_key=api_key,
+        )
+        if response.status != "success":
+            raise ValueError(f"Failed to find the tables: {response.content}")
+        output = json.loads(await fetch_output(response.content["url"]))
+        body = output.get("body", output) if isinstance(output, dict) else output
+        index["tables"] = body.get("tables", []) if isinstance(body, dict) else body
+        credits_used += response.credits_used or 0
+        key, validator, _ = await source_cache_entry(
+            params.url, params.httpusername, params.httppassword
+        )
+        await _save_index(key, validator, index)
+    return _select_pages(index["tables"], params.pages, index), credits_used
+
+
+async def extract_lines(
+    params: ConversionParams, api_key: str | None = None, refresh: bool = False
+) -> tuple[list[dict], int]:
+    """
+    Text lines of the requested pages with their word coordinates, from the
+    document index. Returns the lines and the credits used, which is 0 for
+    documents that are already indexed.
+    """
+    index, credits_used = await get_document_index(params, api_key, refresh)
+    return _select_pages(index["lines"], params.pages, index), credits_used
+
+
+async def _save_index(key: str, validator: str | None, index: dict):
+    _loaded_indexes.put((key, validator), index)
+    # Indexes hold the text of whole documents, so they are written off the event loop
+    await asyncio.to_thread(_index_cache.put, key, index, validator)
+
+
+def _select_pages(items: list[dict], pages: str, index: dict) -> list[dict]:
+    if not pages.strip():
+        return items
+    ranges = parse_page_ranges(pages, len(index["pages"]) or None)
+    # Items without a page index can't be placed, so they are kept
+    return [
+        item
+        for item in items
+        if (page := record_page(item)) is None or page_in_ranges(page, ranges)
+    ]
+
+
+def parse_json2_pages(document: dict) -> list[dict]:
+    """
+    Index and size of each page of a pdf/convert/to/json2 document
+    """
+    pages = document.get("document", {}).get("page", [])
+    if isinstance(pages, dict):
+        pages = [pages]
+    boxes = []
+    for position, page in enumerate(pages):
+        page_index = record_page(page)
+        box = {"page": position if page_index is None else page_index}
+        for name in ("width", "height"):
+            try:
+                box[name] = float(page[f"@{name}"])
+            except (KeyError, TypeError, ValueError):
+                pass
+        boxes.append(box)
+    return boxes
+
+
+def parse_json2_lines(document: dict) -> list[dict]:
+    """
+    Flatten a pdf/convert/to/json2 document into text lines. Each line has the
+    page index, its text and the spans of its words with their coordinates.
+    """
+    pages = document.get("document", {}).get("page", [])
+    if isinstance(pages, dict):
+        pages = [pages]
+
+    lines = []
+    for position, page in enumerate(pages):
+        page_index = record_page(page)
+        page_index = position if page_index is None else page_index
+        rows = page.get("row", [])
+        if isinstance(rows, dict):
+            rows = [rows]
+        for row in rows:
+            words = list(_iter_words(row))
+            if not words:
+                continue
+            text = ""
+            spans = []
+            for word in words:
+                if text:
+                    text += " "
+                spans.append(
+                    {**word, "start": len(text), "end": len(text) + len(word["text"])}
+                )
+                text += word["text"]
+            lines.append({"page": page_index, "text": text, "spans": spans})
+    return lines
+
+
+def _iter_words(node: Any) -> Iterator[dict]:
+    if isinstance(node, list):
+        for item in node:
+            yield from _iter_words(item)
+    elif isinstance(node, dict):
+        if "#text" in node and "@x" in node:
+            try:
+                yield {
+                    "text": str(node["#text"]),
+                    "x": float(node["@x"]),
+                    "y": float(node["@y"]),
+                    "width": float(node.get("@width", 0)),
+                    "height": float(node.get("@height", 0)),
+                }
+            except (TypeError, ValueError):
+                pass
+            return
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _iter_words(value)
+
+
+class MultiPatternMatcher:
+    """
+    Aho-Corasick automaton finding every occurrence of many literal patterns in
+    a single pass over the text
+    """
+
+    def __init__(self, patterns: list[str], case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail = [0]
+        self._output: list[list[int]] = [[]]
+        self._lengths = [len(pattern) for pattern in patterns]
+
+        for index, pattern in enumerate(patterns):
+            node = 0
+            for char in self._normalize(pattern):
+                if char not in self._goto[node]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[node][char] = len(self._goto) - 1
+                node = self._goto[node][char]
+            if pattern:
+                self._output[node].append(index)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                if self._fail[child] == child:
+                    self._fail[child] = 0
+                self._output[child] = (
+                    self._output[child] + self._output[self._fail[child]]
+                )
+
+    def _normalize(self, text: str) -> str:
+        if self.case_sensitive:
+            return text
+        # Keep offsets stable for characters whose lowercase form is longer
+        return "".join(
+            lowered if len(lowered := char.lower()) == 1 else char for char in text
+        )
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """
+        Yield (start, end, pattern index) for every occurrence, including overlaps
+        """
+        node = 0
+        for position, char in enumerate(self._normalize(text)):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for index in self._output[node]:
+                yield position + 1 - self._lengths[index], position + 1, index
+
+
+def search_lines(
+    lines: list[dict],
+    patterns: list[str],
+    regex: bool = False,
+    case_sensitive: bool = False,
+    whole_words: bool = False,
+) -> dict[str, list[dict]]:
+    """
+    Find all patterns in the extracted lines, returning matches per pattern with
+    coordinates in the same shape as 'find_text' results
+    """
+    patterns = list(dict.fromkeys(patterns))
+    results: dict[str, list[dict]] = {pattern: [] for pattern in patterns}
+    if regex:
+        flags = 0 if case_sensitive else re.IGNORECASE
+        compiled = [re.compile(pattern, flags) for pattern in patterns]
+        for line in lines:
+            for pattern, expression in zip(patterns, compiled):
+                for match in expression.finditer(line["text"]):
+                    if match.end() > match.start():
+                        _add_match(
+                            results[pattern],
+                            line,
+                            match.start(),
+                            match.end(),
+                            whole_words,
+                        )
+    else:
+        matcher = MultiPatternMatcher(patterns, case_sensitive=case_sensitive)
+        for line in lines:
+            for start, end, index in matcher.finditer(line["text"]):
+                _add_match(results[patterns[index]], line, start, end, whole_words)
+    return results
+
+
+def _add_match(
+    matches: list[dict], line: dict, start: int, end: int, whole_words: bool
+):
+    text = line["text"]
+    if whole_words and (
+        (start > 0 and text[start - 1].isalnum())
+        or (end < len(text) and text[end].isalnum())
+    ):
+        return
+    spans = [
+        span for span in line["spans"] if span["start"] < end and span["end"] > start
+    ]
+    if not spans:
+        return
+    # Words can be whole phrases, so interpolate the horizontal position of the
+    # match within its first and last words from the character offsets
+    first, last = spans[0], spans[-1]
+    left = first["x"] + first["width"] * _fraction(first, start)
+    right = last["x"] + last["width"] * _fraction(last, end)
+    top = min(span["y"] for span in spans)
+    bottom = max(span["y"] + span["height"] for span in spans)
+    matches.append(
+        {
+            "text": text[start:end],
+            "left": left,
+            "top": top,
+            "width": right - left,
+            "height": bottom - top,
+            "pageIndex": line["page"],
+            "bounds": {
+                "left": left,
+                "top": top,
+                "right": right,
+                "bottom": bottom,
+                "width": right - left,
+                "height": bottom - top,
+            },
+        }
+    )
+
+
+def _fraction(span: dict, offset: int) -> float:
+    length = span["end"] - span["start"]
+    if length <= 0:
+        return 0
+    return min(max(offset - span["start"], 0), length) / length
+
+
+async def find_text_indexed(
+    params: ConversionParams,
+    search_string: str,
+    regex_search: bool = False,
+    word_matching_mode: str | None = None,
+    api_key: str | None = None,
+    refresh: bool = False,
+) -> BaseResponse:
+    """
+    Answer a pdf/find query from the document index. ExactMatch is matched as
+    case-sensitive whole words, SmartMatch as whole words ignoring case.
+    """
+    lines, credits_used = await extract_lines(params, api_key, refresh)
+    matches = search_lines(
+        lines,
+        [search_string],
+        regex=regex_search,
+        case_sensitive=word_matching_mode == "ExactMatch",
+        whole_words=word_matching_mode in ("ExactMatch", "SmartMatch"),
+    )[search_string]
+    return BaseResponse(
+        status="success",
+        content={"body": matches},
+        credits_used=credits_used,
+        tips=_index_tips(credits_used),
+    )
+
+
+async def find_table_indexed(
+    params: ConversionParams, api_key: str | None = None, refresh: bool = False
+) -> BaseResponse:
+    """
+    Answer a pdf/find/table query from the document index
+    """
+    tables, credits_used = await get_indexed_tables(params, api_key, refresh)
+    return BaseResponse(
+        status="success",
+        content={"body": {"tables": tables}},
+        credits_used=credits_used,
+        tips=_index_tips(credits_used),
+    )
+
+
+def _index_tips(credits_used: int) -> str:
+    if credits_used:
+        return "The document was indexed, later searches are answered from the index without new jobs"
+    return "Answered from the document index. Set refresh to True to index the document again"
@@ -0,0 +1,131 @@
+import time
+from typing import Awaitable, Callable
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    gather_limited,
+    skipped_response,
+)
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.pdf import add_pdf_password, remove_pdf_password
+from pdfco.mcp.services.preflight import get_upload_preflight
+
+
+async def add_pdf_passwords_bulk(
+    urls: list[str],
+    params: ConversionParams,
+    owner_password: str = "",
+    owner_passwords: dict[str, str] | None = None,
+    user_passwords: dict[str, str] | None = None,
+    passwords: dict[str, str] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+    **kwargs,
+) -> BaseResponse:
+    """
+    Password protect many PDFs with the same security settings. Owner, user and
+    current passwords can be set per URL, falling back to the shared values.
+    """
+    owner_passwords = owner_passwords or {}
+    user_passwords = user_passwords or {}
+    passwords = passwords or {}
+    missing = [url for url in urls if not owner_passwords.get(url, owner_password)]
+    if missing:
+        raise ValueError(f"No owner password for: {', '.join(missing)}")
+
+    async def protect(url: str) -> BaseResponse:
+        payload = {**kwargs, "ownerPassword": owner_passwords.get(url, owner_password)}
+        if url in user_passwords:
+            payload["userPassword"] = user_passwords[url]
+        return await complete_job(
+            await add_pdf_password(
+                _file_params(params, url, passwords), api_key=api_key, **payload
+            ),
+            api_key=api_key,
+        )
+
+    return await _run_bulk(urls, protect, concurrency, api_key)
+
+
+async def remove_pdf_passwords_bulk(
+    urls: list[str],
+    params: ConversionParams,
+    passwords: dict[str, str] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+) -> BaseResponse:
+    """
+    Remove the password protection of many PDFs. Passwords can be set per URL,
+    falling back to the shared password. Uploaded files that are known not to
+    be encrypted are returned as they are.
+    """
+    passwords = passwords or {}
+
+    async def unprotect(url: str) -> BaseResponse:
+        preflight = get_upload_preflight(url)
+        if preflight and preflight.encrypted is False:
+            return BaseResponse(status="success", content={"url": url})
+        return await complete_job(
+            await remove_pdf_password(
+                _file_params(params, url, passwords), api_key=api_key
+            ),
+            api_key=api_key,
+        )
+
+    return await _run_bulk(urls, unprotect, concurrency, api_key)
+
+
+def _file_params(
+    params: ConversionParams, url: str, passwords: dict[str, str]
+) -> ConversionParams:
+    return params.model_copy(
+        update={"url": url, "password": passwords.get(url, params.password)}
+    )
+
+
+async def _run_bulk(
+    urls: list[str],
+    run: Callable[[str], Awaitable[BaseResponse]],
+    concurrency: int,
+    api_key: str | None,
+) -> BaseResponse:
+    start_time = time.time()
+
+    async def timed(url: str) -> tuple[BaseResponse, float]:
+        file_start = time.time()
+        response = await run(url)
+        return response, round(time.time() - file_start, 3)
+
+    async with PDFCoClientPool(api_key=api_key):
+        responses = await gather_limited(
+            timed, urls, concurrency, skipped=lambda url: (skipped_response(), 0.0)
+        )
+
+    results = []
+    credits_used = 0
+    credits_remaining = None
+    for url, (response, duration) in zip(urls, responses):
+        credits_used += response.credits_used or 0
+        credits_remaining = response.credits_remaining or credits_remaining
+        result = {"source": url, "status": response.status, "duration": duration}
+        if response.status == "success":
+            result["url"] = response.content["url"]
+        else:
+            result["error"] = response.content
+        results.append(result)
+
+    failed = sum(result["status"] != "success" for result in results)
+    return BaseResponse(
+        status="success" if failed == 0 else "error",
+        content={
+            "results": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "duration": round(time.time() - start_time, 3),
+        },
+        credits_used=credits_used,
+        credits_remaining=credits_remaining,
+        tips="All jobs are already complete, no need to wait for them",
+    )
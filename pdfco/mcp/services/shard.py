@@ -0,0 +1,208 @@
+import json
+import time
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    gather_limited,
+    skipped_response,
+)
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.file import upload_content
+from pdfco.mcp.services.info import get_page_count
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.output import fetch_output
+from pdfco.mcp.services.pages import (
+    chunk_contiguous_pages,
+    chunk_page_indices,
+    expand_page_ranges,
+    format_page_indices,
+)
+from pdfco.mcp.services.pdf import merge_pdf, request, split_pdf
+
+# How the outputs of the shards are put back together
+SHARD_OUTPUTS = ("text", "json", "pdf")
+
+
+async def run_sharded(
+    endpoint: str,
+    params: ConversionParams,
+    output: str,
+    shard_size: int,
+    api_key: str | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> BaseResponse:
+    """
+    Split the page range of a job into shards of `shard_size` pages, run them as
+    parallel jobs and reassemble the outputs in page order: text outputs are
+    concatenated, JSON outputs have their pages merged and PDF outputs are merged
+    with pdf/merge2. Returns the finished result, there is no job to wait for.
+    """
+    if output not in SHARD_OUTPUTS:
+        raise ValueError(f"Unsupported shard output: {output}")
+
+    try:
+        return await _run_sharded(
+            endpoint, params, output, shard_size, api_key, concurrency
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=f"{type(e)}: {[arg for arg in e.args if arg]}",
+        )
+
+
+async def _run_sharded(
+    endpoint: str,
+    params: ConversionParams,
+    output: str,
+    shard_size: int,
+    api_key: str | None,
+    concurrency: int,
+) -> BaseResponse:
+    if shard_size < 1:
+        raise ValueError(f"Invalid shard size {shard_size}, use at least 1 page")
+
+    start_time = time.time()
+    async with PDFCoClientPool(api_key=api_key):
+        page_count = await get_page_count(params, api_key=api_key, verify=True)
+        indices = expand_page_ranges(params.pages, page_count)
+
+        split_credits = 0
+        if output == "pdf":
+            # `pages` may only select the pages an endpoint processes while the
+            # output keeps the whole document, so PDF shards of consecutive pages
+            # are split off first and processed whole
+            chunks = chunk_contiguous_pages(indices, shard_size)
+            shards = [format_page_indices(chunk) for chunk in chunks]
+            # pdf/split numbers pages from 1
+            split_pages = ",".join(
+                format_page_indices([index + 1 for index in chunk]) for chunk in chunks
+            )
+            split = await complete_job(
+                await split_pdf(
+                    params.model_copy(update={"pages": split_pages, "name": ""}),
+                    api_key=api_key,
+                ),
+                api_key=api_key,
+            )
+            if split.status != "success":
+                return BaseResponse(
+                    status="error",
+                    content={"page_count": page_count, "split": split.content},
+                    credits_used=split.credits_used,
+                    credits_remaining=split.credits_remaining,
+                )
+            split_credits = split.credits_used or 0
+            sources = split.content.get("urls") or []
+            if len(sources) != len(shards):
+                raise ValueError(
+                    f"Expected {len(shards)} split parts, got {len(sources)}"
+                )
+            shard_params = [
+                ConversionParams(url=source, lang=params.lang) for source in sources
+            ]
+        else:
+            shards = chunk_page_indices(indices, shard_size)
+            shard_params = [
+                params.model_copy(update={"pages": pages}) for pages in shards
+            ]
+
+        async def run_shard(shard: ConversionParams) -> BaseResponse:
+            return await complete_job(
+                await request(endpoint, shard, api_key=api_key),
+                api_key=api_key,
+            )
+
+        results = await gather_limited(
+            run_shard, shard_params, concurrency, skipped=skipped_response
+        )
+        credits_used = split_credits + sum(
+            result.credits_used or 0 for result in results
+        )
+        credits_remaining = min(
+            (r.credits_remaining for r in results if r.credits_remaining is not None),
+            default=None,
+        )
+        shard_results = [
+            {
+                "pages": pages,
+                "status": result.status,
+                "url": result.content.get("url")
+                if isinstance(result.content, dict)
+                else None,
+                "error": None if result.status == "success" else result.content,
+            }
+            for pages, result in zip(shards, results)
+        ]
+        if any(result.status != "success" for result in results):
+            return BaseResponse(
+                status="error",
+                content={"page_count": page_count, "shards": shard_results},
+                credits_used=credits_used,
+                credits_remaining=credits_remaining,
+                tips="Some shards failed, see the shard errors",
+            )
+
+        urls = [shard["url"] for shard in shard_results]
+        if output == "pdf":
+            merged = await complete_job(
+                await merge_pdf(
+                    ConversionParams(url=",".join(urls), name=params.name),
+                    api_key=api_key,
+                ),
+                api_key=api_key,
+            )
+            credits_used += merged.credits_used or 0
+            if merged.status != "success":
+                return BaseResponse(
+                    status="error",
+                    content={"shards": shard_results, "merge": merged.content},
+                    credits_used=credits_used,
+                    credits_remaining=credits_remaining,
+                )
+            url = merged.content["url"]
+        else:
+            url = await _upload_combined(output, urls, params.name, api_key)
+
+    return BaseResponse(
+        status="success",
+        content={
+            "url": url,
+            "page_count": page_count,
+            "shards": shard_results,
+            "duration": round(time.time() - start_time, 3),
+        },
+        credits_used=credits_used,
+        credits_remaining=credits_remaining,
+        tips="The sharded job is already complete, no need to wait for it",
+    )
+
+
+async def _upload_combined(
+    output: str, urls: list[str], name: str, api_key: str | None
+) -> str:
+    parts = await gather_limited(
+        lambda url: fetch_output(url, use_cache=False), urls, max(len(urls), 1)
+    )
+    if output == "text":
+        content = parts[0] + b"".join(
+            part.removeprefix(b"\xef\xbb\xbf") for part in parts[1:]
+        )
+        file_name = name or "result.txt"
+    else:
+        documents = [json.loads(part) for part in parts]
+        combined = documents[0]
+        pages = combined["document"]["page"]
+        if not isinstance(pages, list):
+            combined["document"]["page"] = pages = [pages]
+        for document in documents[1:]:
+            more = document["document"]["page"]
+            pages.extend(more if isinstance(more, list) else [more])
+        content = json.dumps(combined, ensure_ascii=False).encode("utf-8")
+        file_name = name or "result.json"
+
+    res = await upload_content(file_name, content, api_key=api_key)
+    if res.get("status") != 200:
+        raise ValueError(f"Failed to upload the combined output: {res}")
+    return res["url"]
@@ -0,0 +1,126 @@
+import time
+from typing import Awaitable, Callable
+
+from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    SKIPPED_ERROR,
+    gather_limited,
+    numbered_name,
+)
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.job import complete_job
+from pdfco.mcp.services.pdf import request, split_pdf
+
+# Operations that can be run on each part of a split
+FOLLOW_UPS = {
+    "text": "pdf/convert/to/text",
+    "json": "pdf/convert/to/json2",
+    "invoice": "ai-invoice-parser",
+}
+
+
+def part_pages(pages: str, part_count: int) -> list[str]:
+    """
+    The page ranges of the parts of a pdf/split result, in part order. '*'
+    numbers every page as its own part. Ranges are left empty when the
+    selection can't be matched to the parts.
+    """
+    tokens = [token for token in pages.replace(" ", "").split(",") if token]
+    if tokens == ["*"]:
+        return [str(page) for page in range(1, part_count + 1)]
+    if "*" in tokens or len(tokens) != part_count:
+        return [""] * part_count
+    return tokens
+
+
+async def split_and_process(
+    params: ConversionParams,
+    follow_up: str = "",
+    concurrency: int = DEFAULT_CONCURRENCY,
+    api_key: str | None = None,
+    on_part: Callable[[dict, int, int], Awaitable[None]] | None = None,
+) -> BaseResponse:
+    """
+    Split a PDF with a single pdf/split job, so it costs the same as a plain
+    split, and optionally run a follow-up operation on the parts concurrently.
+    `on_part` receives each finished part with the number of parts finished so
+    far and in total.
+    """
+    if follow_up and follow_up not in FOLLOW_UPS:
+        raise ValueError(
+            f"Unsupported follow-up '{follow_up}', use one of: {', '.join(FOLLOW_UPS)}"
+        )
+
+    start_time = time.time()
+    credits_used = 0
+    credits_remaining = None
+    finished = 0
+
+    def add_credits(result: BaseResponse):
+        nonlocal credits_used, credits_remaining
+        credits_used += result.credits_used or 0
+        credits_remaining = result.credits_remaining or credits_remaining
+
+    async with PDFCoClientPool(api_key=api_key):
+        split = await complete_job(
+            await split_pdf(params, api_key=api_key), api_key=api_key
+        )
+        if split.status != "success":
+            return split
+        add_credits(split)
+        urls = split.content.get("urls") or [split.content.get("url")]
+        ranges = part_pages(params.pages, len(urls))
+
+        async def process(item: tuple[int, str]) -> dict:
+            nonlocal finished
+            index, url = item
+            part_start = time.time()
+            part = {"part": index + 1, "status": "success", "url": url}
+            if ranges[index]:
+                part["pages"] = ranges[index]
+            if follow_up:
+                result = await complete_job(
+                    await request(
+                        FOLLOW_UPS[follow_up],
+                        ConversionParams(url=url),
+                        api_key=api_key,
+                    ),
+                    api_key=api_key,
+                )
+                add_credits(result)
+                if result.status == "success":
+                    part[f"{follow_up}_url"] = result.content.get("url")
+                else:
+                    part.update(status="error", error=result.content)
+            part["duration"] = round(time.time() - part_start, 3)
+            finished += 1
+            if on_part:
+                await on_part(part, finished, len(urls))
+            return part
+
+        results = await gather_limited(
+            process,
+            list(enumerate(urls)),
+            concurrency,
+            skipped=lambda item: {
+                "part": item[0] + 1,
+                "status": "error",
+                "url": item[1],
+                "error": SKIPPED_ERROR,
+            },
+        )
+
+    failed = sum(part["status"] != "success" for part in results)
+    return BaseResponse(
+        status="success" if failed == 0 else "error",
+        content={
+            "parts": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "duration": round(time.time() - start_time, 3),
+        },
+        credits_used=credits_used,
+        credits_remaining=credits_remaining,
+        tips="All parts are already complete, no need to wait for them",
+    )
@@ -1,7 +1,16 @@
+import json
+
 from pdfco.mcp.server import mcp
 from pdfco.mcp.services.pdf import convert_to, convert_from
+from pdfco.mcp.services.shard import run_sharded
+from pdfco.mcp.services.batch import DEFAULT_CONCURRENCY
+from pdfco.mcp.services.crawl import crawl_to_pdf
+from pdfco.mcp.services.excel import convert_all_sheets
+from pdfco.mcp.services.render import render_html_bulk
+from pdfco.mcp.services.images import render_page_images
 from pdfco.mcp.models import BaseResponse, ConversionParams
 
+from fastmcp import Context
 from pydantic import Field
 
 
@@ -44,6 +53,10 @@ async def pdf_to_json(
     name: str = Field(
         description="File name for the generated output. (Optional)", default=""
     ),
+    shard_size: int = Field(
+        description="Split large documents into shards of this many pages that are processed as parallel jobs and reassembled in page order. The result is returned when all shards are done. Disabled if 0. (Optional)",
+        default=0,
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
@@ -53,24 +66,25 @@ async def pdf_to_json(
     Convert PDF and scanned images into JSON representation with text, fonts, images, vectors, and formatting preserved using the /pdf/convert/to/json2 endpoint.
     Ref: https://developer.pdf.co/api-reference/pdf-to-json/basic.md
     """
-    return await convert_to(
-        "pdf",
-        "json2",
-        ConversionParams(
-            url=url,
-            httpusername=httpusername,
-            httppassword=httppassword,
-            pages=pages,
-            unwrap=unwrap,
-            rect=rect,
-            lang=lang,
-            line_grouping=line_grouping,
-            password=password,
-            name=name,
-        ),
-        api_key=api_key,
+    params = ConversionParams(
+        url=url,
+        httpusername=httpusername,
+        httppassword=httppassword,
+        pages=pages,
+        unwrap=unwrap,
+        rect=rect,
+        lang=lang,
+        line_grouping=line_grouping,
+        password=password,
+        name=name,
     )
 
+    if shard_size:
+        return await run_sharded(
+            "pdf/convert/to/json2", params, "json", shard_size, api_key=api_key
+        )
+    return await convert_to("pdf", "json2", params, api_key=api_key)
+
 
 @mcp.tool()
 async def pdf_to_csv(
@@ -178,6 +192,10 @@ async def pdf_to_text(
     name: str = Field(
         description="File name for the generated output. (Optional)", default=""
     ),
+    shard_size: int = Field(
+        description="Split large documents into shards of this many pages that are processed as parallel jobs and reassembled in page order. The result is returned when all shards are done. Disabled if 0. (Optional)",
+        default=0,
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
@@ -187,24 +205,25 @@ async def pdf_to_text(
     Convert PDF and scanned images to text with layout preserved.
     Ref: https://developer.pdf.co/api-reference/pdf-to-text/basic.md
     """
-    return await convert_to(
-        "pdf",
-        "text",
-        ConversionParams(
-            url=url,
-            httpusername=httpusername,
-            httppassword=httppassword,
-            pages=pages,
-            unwrap=unwrap,
-            rect=rect,
-            lang=lang,
-            line_grouping=line_grouping,
-            password=password,
-            name=name,
-            api_key=api_key,
-        ),
+    params = ConversionParams(
+        url=url,
+        httpusername=httpusername,
+        httppassword=httppassword,
+        pages=pages,
+        unwrap=unwrap,
+        rect=rect,
+        lang=lang,
+        line_grouping=line_grouping,
+        password=password,
+        name=name,
     )
 
+    if shard_size:
+        return await run_sharded(
+            "pdf/convert/to/text", params, "text", shard_size, api_key=api_key
+        )
+    return await convert_to("pdf", "text", params, api_key=api_key)
+
 
 @mcp.tool()
 async def pdf_to_xls(
@@ -518,10 +537,19 @@ async def pdf_to_image(
         default="jpg",
         choices=["jpg", "png", "webp", "tiff"],
     ),
+    chunk_size: int = Field(
+        description="Set to split the pages into concurrent jobs of this many pages. Each page's image URL is delivered as a progress notification as soon as its chunk finishes, and the finished result is returned with no job to wait for. Page images are cached per document, page and format. Leave 0 to convert all pages in a single job. (Optional)",
+        default=0,
+    ),
+    use_cache: bool = Field(
+        description="Set to False to render pages again instead of using cached images when chunk_size is set. (Optional)",
+        default=True,
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
     ),
+    ctx: Context | None = None,
 ) -> BaseResponse:
     """
     Convert PDF and scanned images to various image formats (JPG, PNG, WebP, TIFF).
@@ -531,24 +559,42 @@ async def pdf_to_image(
      - https://developer.pdf.co/api-reference/pdf-to-image/webp.md
      - https://developer.pdf.co/api-reference/pdf-to-image/tiff.md
     """
-    return await convert_to(
-        "pdf",
-        type,
-        ConversionParams(
-            url=url,
-            httpusername=httpusername,
-            httppassword=httppassword,
-            pages=pages,
-            unwrap=unwrap,
-            rect=rect,
-            lang=lang,
-            line_grouping=line_grouping,
-            password=password,
-            name=name,
-            api_key=api_key,
-        ),
+    params = ConversionParams(
+        url=url,
+        httpusername=httpusername,
+        httppassword=httppassword,
+        pages=pages,
+        unwrap=unwrap,
+        rect=rect,
+        lang=lang,
+        line_grouping=line_grouping,
+        password=password,
+        name=name,
     )
 
+    if chunk_size > 0:
+
+        async def on_page(image: dict, delivered: int, total: int):
+            if ctx:
+                await ctx.report_progress(delivered, total, message=json.dumps(image))
+
+        try:
+            return await render_page_images(
+                params,
+                type,
+                chunk_size,
+                use_cache=use_cache,
+                api_key=api_key,
+                on_page=on_page,
+            )
+        except Exception as e:
+            return BaseResponse(
+                status="error",
+                content=str(e),
+            )
+
+    return await convert_to("pdf", type, params, api_key=api_key)
+
 
 @mcp.tool()
 async def document_to_pdf(
@@ -777,6 +823,124 @@ async def webpage_to_pdf(
     )
 
 
+@mcp.tool()
+async def webpage_to_pdf_crawl(
+    url: str = Field(
+        description="Seed webpage URL to start crawling from. Multiple seeds can be separated by commas."
+    ),
+    max_depth: int = Field(
+        description="Number of link levels to follow from the seed pages. 0 converts only the seeds. (Optional)",
+        default=1,
+    ),
+    max_pages: int = Field(
+        description="Maximum number of pages to convert. (Optional)", default=20
+    ),
+    same_host: bool = Field(
+        description="Only follow links to the hosts of the seed URLs. (Optional)",
+        default=True,
+    ),
+    merge: bool = Field(
+        description="Merge the converted pages into one PDF in crawl order. (Optional)",
+        default=False,
+    ),
+    margins: str = Field(
+        description="Set to CSS style margins like 10px, 5mm, 5in for all sides or 5px 5px 5px 5px (the order of margins is top, right, bottom, left). (Optional)",
+        default="",
+    ),
+    paperSize: str = Field(
+        description="A4 is set by default. Can be Letter, Legal, Tabloid, Ledger, A0, A1, A2, A3, A4, A5, A6 or a custom size. Custom size can be set in px (pixels), mm or in (inches) with width and height separated by space like this: 200 300, 200px 300px, 200mm 300mm, 20cm 30cm or 6in 8in. (Optional)",
+        default="",
+    ),
+    orientation: str = Field(
+        description="Set to Portrait or Landscape. Portrait is set by default. (Optional)",
+        default="",
+    ),
+    printBackground: bool = Field(
+        description="true by default. Set to false to disable printing of background. (Optional)",
+        default=True,
+    ),
+    mediaType: str = Field(
+        description="Uses print by default. Set to screen to convert HTML as it appears in a browser or print to convert as it appears for printing or none to set none as mediaType for CSS styles. (Optional)",
+        default="",
+    ),
+    DoNotWaitFullLoad: bool = Field(
+        description="false by default. Set to true to skip waiting for full load (like full video load etc. that may affect the total conversion time). (Optional)",
+        default=False,
+    ),
+    header: str = Field(
+        description="User definable HTML for the header to be applied on every page header. (Optional)",
+        default="",
+    ),
+    footer: str = Field(
+        description="User definable HTML for the footer to be applied on every page footer. (Optional)",
+        default="",
+    ),
+    httpusername: str = Field(
+        description="HTTP auth user name if required to access source url. (Optional)",
+        default="",
+    ),
+    httppassword: str = Field(
+        description="HTTP auth password if required to access source url. (Optional)",
+        default="",
+    ),
+    name: str = Field(
+        description="File name for the generated outputs, numbered per page, or for the merged PDF. (Optional)",
+        default="",
+    ),
+    concurrency: int = Field(
+        description="Maximum number of pages converted at the same time. (Optional)",
+        default=DEFAULT_CONCURRENCY,
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+    ctx: Context | None = None,
+) -> BaseResponse:
+    """
+    Crawl a website from seed URLs and convert every page found to PDF, e.g. to archive a documentation site.
+    Links are followed breadth first up to max_depth levels and max_pages pages, and URLs are normalized so each page is converted once.
+    Pages of a level are converted concurrently. Optionally merges the PDFs in crawl order. Returns per-page fetch and conversion times.
+    Ref: https://developer.pdf.co/api-reference/pdf-from-url.md
+    """
+
+    async def on_page(page: dict, finished: int, total: int):
+        if ctx:
+            await ctx.report_progress(
+                finished, total, message=f"{page['status']}: {page['url']}"
+            )
+
+    try:
+        return await crawl_to_pdf(
+            [seed.strip() for seed in url.split(",") if seed.strip()],
+            ConversionParams(
+                margins=margins,
+                paperSize=paperSize,
+                orientation=orientation,
+                printBackground=printBackground,
+                mediaType=mediaType,
+                DoNotWaitFullLoad=DoNotWaitFullLoad,
+                header=header,
+                footer=footer,
+                httpusername=httpusername,
+                httppassword=httppassword,
+                name=name,
+            ),
+            max_depth=max_depth,
+            max_pages=max_pages,
+            same_host=same_host,
+            merge=merge,
+            concurrency=concurrency,
+            api_key=api_key,
+            on_page=on_page,
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
+
+
 @mcp.tool()
 async def html_to_pdf(
     html: str = Field(
@@ -866,6 +1030,95 @@ async def html_to_pdf(
     )
 
 
+@mcp.tool()
+async def html_to_pdf_bulk(
+    records: list[dict] = Field(
+        description="Data records to render, one PDF per record. Each record is passed as the template data."
+    ),
+    templateId: str = Field(
+        description="Set to the ID of your HTML template. You can find and copy the ID from HTML to PDF Templates. Either templateId or html is required.",
+        default="",
+    ),
+    html: str = Field(
+        description="Inline HTML template with placeholders like {{name}} and blocks like {{#each items}}...{{/each}}, filled by PDF.co from each record. It is sent with every job, use templateId to send it only once. Either templateId or html is required.",
+        default="",
+    ),
+    margins: str = Field(
+        description="Set to CSS style margins like 10px, 5mm, 5in for all sides or 5px 5px 5px 5px (the order of margins is top, right, bottom, left). (Optional)",
+        default="",
+    ),
+    paperSize: str = Field(
+        description="A4 is set by default. Can be Letter, Legal, Tabloid, Ledger, A0, A1, A2, A3, A4, A5, A6 or a custom size. Custom size can be set in px (pixels), mm or in (inches) with width and height separated by space like this: 200 300, 200px 300px, 200mm 300mm, 20cm 30cm or 6in 8in. (Optional)",
+        default="",
+    ),
+    orientation: str = Field(
+        description="Set to Portrait or Landscape. Portrait is set by default. (Optional)",
+        default="",
+    ),
+    printBackground: bool = Field(
+        description="true by default. Set to false to disable printing of background. (Optional)",
+        default=True,
+    ),
+    mediaType: str = Field(
+        description="Uses print by default. Set to screen to convert HTML as it appears in a browser or print to convert as it appears for printing or none to set none as mediaType for CSS styles. (Optional)",
+        default="",
+    ),
+    DoNotWaitFullLoad: bool = Field(
+        description="false by default. Set to true to skip waiting for full load (like full video load etc. that may affect the total conversion time). (Optional)",
+        default=False,
+    ),
+    header: str = Field(
+        description="User definable HTML for the header to be applied on every page header. (Optional)",
+        default="",
+    ),
+    footer: str = Field(
+        description="User definable HTML for the footer to be applied on every page footer. (Optional)",
+        default="",
+    ),
+    name: str = Field(
+        description="File name for the generated outputs, numbered per record. (Optional)",
+        default="",
+    ),
+    concurrency: int = Field(
+        description="Maximum number of documents rendered at the same time. (Optional)",
+        default=DEFAULT_CONCURRENCY,
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    Render one PDF per data record from a shared HTML template, running the jobs concurrently.
+    Each record is sent as templateData and the template is filled by PDF.co. With templateId only the record data is sent with each job.
+    Returns the output URLs in record order with throughput stats.
+    Ref: https://developer.pdf.co/api-reference/pdf-from-html/convert.md
+    """
+    params = ConversionParams(
+        html=html,
+        templateId=templateId,
+        margins=margins,
+        paperSize=paperSize,
+        orientation=orientation,
+        printBackground=printBackground,
+        mediaType=mediaType,
+        DoNotWaitFullLoad=DoNotWaitFullLoad,
+        header=header,
+        footer=footer,
+        name=name,
+    )
+
+    try:
+        return await render_html_bulk(
+            params, records, concurrency=concurrency, api_key=api_key
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
+
+
 @mcp.tool()
 async def email_to_pdf(
     url: str = Field(
@@ -1165,3 +1418,62 @@ async def excel_to_pdf(
             api_key=api_key,
         ),
     )
+
+
+@mcp.tool()
+async def excel_convert_all_sheets(
+    url: str = Field(
+        description="URL to the source file (XLS, XLSX). Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage. Use 'upload_file' tool to upload local files."
+    ),
+    output: str = Field(
+        description="Output format of each sheet: csv, json, html, txt, xml or pdf."
+    ),
+    sheet_count: int = Field(
+        description="Number of worksheets. Required for XLS workbooks, whose sheet names can't be discovered. XLSX sheets are discovered from the workbook when not set. (Optional)",
+        default=0,
+    ),
+    httpusername: str = Field(
+        description="HTTP auth user name if required to access source url. (Optional)",
+        default="",
+    ),
+    httppassword: str = Field(
+        description="HTTP auth password if required to access source url. (Optional)",
+        default="",
+    ),
+    name: str = Field(
+        description="File name for the generated outputs, suffixed with the sheet name. (Optional)",
+        default="",
+    ),
+    concurrency: int = Field(
+        description="Maximum number of sheets converted at the same time. (Optional)",
+        default=DEFAULT_CONCURRENCY,
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    Convert every worksheet of an Excel workbook (XLS, XLSX) at once, running one conversion per sheet concurrently.
+    Use this instead of calling the excel_to_* tools once per worksheetIndex.
+    Returns a mapping of sheet name to output URL with the total credits used.
+    Ref: https://developer.pdf.co/api-reference/convert-from-excel/csv.md
+    """
+    try:
+        return await convert_all_sheets(
+            ConversionParams(
+                url=url,
+                httpusername=httpusername,
+                httppassword=httppassword,
+                name=name,
+            ),
+            output,
+            sheet_count=sheet_count,
+            concurrency=concurrency,
+            api_key=api_key,
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
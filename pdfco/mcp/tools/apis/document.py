@@ -1,5 +1,7 @@
 from pdfco.mcp.server import mcp
 from pdfco.mcp.services.pdf import get_pdf_info
+from pdfco.mcp.services.batch import DEFAULT_CONCURRENCY
+from pdfco.mcp.services.info import lookup_pdf_info, read_pdf_info_bulk, select_fields
 from pdfco.mcp.models import BaseResponse, ConversionParams
 
 from pydantic import Field
@@ -38,3 +40,104 @@ async def pdf_info_reader(
     )
 
     return await get_pdf_info(params, api_key=api_key)
+
+
+@mcp.tool()
+async def pdf_info_reader_bulk(
+    urls: list[str] = Field(
+        description="URLs to the source PDF files. Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage. Use 'upload_files' tool to upload local files."
+    ),
+    fields: list[str] = Field(
+        description="Information keys to return for each document, e.g. ['PageCount', 'Encrypted', 'Producer']. Returns all keys if empty. (Optional)",
+        default=[],
+    ),
+    refresh: bool = Field(
+        description="Set to True to read the information again instead of using cached results. (Optional)",
+        default=False,
+    ),
+    httpusername: str = Field(
+        description="HTTP auth user name if required to access source urls. (Optional)",
+        default="",
+    ),
+    httppassword: str = Field(
+        description="HTTP auth password if required to access source urls. (Optional)",
+        default="",
+    ),
+    password: str = Field(
+        description="Password of the PDF files. (Optional)", default=""
+    ),
+    concurrency: int = Field(
+        description="Maximum number of documents read at the same time. (Optional)",
+        default=DEFAULT_CONCURRENCY,
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    Get information about many PDF documents at once - number of pages, metadata, security and more - for routing and triage.
+    Documents are read concurrently and results are cached per document, so documents read before are answered without a new request.
+    Ref: https://developer.pdf.co/api-reference/pdf-info-reader.md
+    """
+    params = ConversionParams(
+        httpusername=httpusername,
+        httppassword=httppassword,
+        password=password,
+    )
+
+    try:
+        return await read_pdf_info_bulk(
+            urls,
+            params,
+            fields=fields,
+            refresh=refresh,
+            concurrency=concurrency,
+            api_key=api_key,
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
+
+
+@mcp.tool()
+async def pdf_info_lookup(
+    url: str = Field(
+        description="URL to the source PDF file. Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage."
+    ),
+    fields: list[str] = Field(
+        description="Information keys to return, e.g. ['PageCount', 'Encrypted', 'Producer']. Returns all keys if empty. (Optional)",
+        default=[],
+    ),
+    httpusername: str = Field(
+        description="HTTP auth user name if required to access source url. (Optional)",
+        default="",
+    ),
+    httppassword: str = Field(
+        description="HTTP auth password if required to access source url. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    Look up the cached information of a PDF document read before by 'pdf_info_reader_bulk', without submitting a request or using credits.
+    """
+    try:
+        info = await lookup_pdf_info(
+            ConversionParams(
+                url=url, httpusername=httpusername, httppassword=httppassword
+            )
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
+    if info is None:
+        return BaseResponse(
+            status="error",
+            content=f"No cached information for {url}",
+            tips="Use 'pdf_info_reader_bulk' to read the information",
+        )
+    return BaseResponse(status="success", content=select_fields(info, fields))
@@ -1,5 +1,6 @@
 from pdfco.mcp.server import mcp
 from pdfco.mcp.services.pdf import pdf_add
+from pdfco.mcp.services.forms import get_cached_form_fields, unknown_field_names
 from pdfco.mcp.models import BaseResponse, ConversionParams
 
 from pydantic import Field
@@ -85,6 +86,17 @@ async def pdf_add_annotations_images_fields(
         expiration=expiration,
     )
 
+    if fields:
+        form_fields = await get_cached_form_fields(params)
+        if form_fields is not None and (
+            unknown := unknown_field_names(fields, form_fields)
+        ):
+            return BaseResponse(
+                status="error",
+                content=f"Unknown form fields: {', '.join(unknown)}",
+                tips=f"Valid field names are: {', '.join(list(form_fields)[:50])}",
+            )
+
     # Prepare additional parameters
     add_params = {}
 
@@ -1,5 +1,8 @@
 from pdfco.mcp.server import mcp
 from pdfco.mcp.services.pdf import parse_invoice, extract_pdf_attachments
+from pdfco.mcp.services.batch import DEFAULT_CONCURRENCY
+from pdfco.mcp.services.invoice import parse_invoices_bulk
+from pdfco.mcp.services.attachments import extract_attachments_recursive
 from pdfco.mcp.models import BaseResponse, ConversionParams
 
 from pydantic import Field
@@ -28,6 +31,49 @@ async def ai_invoice_parser(
     return await parse_invoice(params, api_key=api_key)
 
 
+@mcp.tool()
+async def ai_invoice_parser_bulk(
+    urls: list[str] = Field(
+        description="URLs to the source invoice PDF files. Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage. Use 'upload_files' tool to upload local files."
+    ),
+    table_format: str = Field(
+        description="Format of the table of parsed invoices: csv or jsonl. (Optional)",
+        default="csv",
+    ),
+    refresh: bool = Field(
+        description="Set to True to parse invoices again instead of using cached results for the same content. (Optional)",
+        default=False,
+    ),
+    concurrency: int = Field(
+        description="Maximum number of invoices parsed at the same time. (Optional)",
+        default=DEFAULT_CONCURRENCY,
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    AI Invoice Parser for many invoices: parses invoices concurrently, parsing files with the same content only once, and caches results by content hash.
+    The parsed fields are flattened into one row per invoice (nested fields as dotted column names, line items as JSON) and uploaded as a CSV or JSONL table.
+    Returns the table URL with the latency and credits of each document.
+    Ref: https://developer.pdf.co/api-reference/ai-invoice-parser.md
+    """
+    try:
+        return await parse_invoices_bulk(
+            urls,
+            table_format=table_format,
+            refresh=refresh,
+            concurrency=concurrency,
+            api_key=api_key,
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
+
+
 @mcp.tool()
 async def extract_attachments(
     url: str = Field(description="URL to the source PDF file."),
@@ -40,6 +86,14 @@ async def extract_attachments(
         default="",
     ),
     password: str = Field(description="Password of PDF file. (Optional)", default=""),
+    recursive: bool = Field(
+        description="Set to True to also extract the attachments of attached PDFs, level by level up to max_depth. Returns a flat manifest of all attachments with identical attachments listed once. The finished result is returned, there is no job to wait for. (Optional)",
+        default=False,
+    ),
+    max_depth: int = Field(
+        description="Maximum nesting depth of attachments extracted when recursive is True. (Optional)",
+        default=3,
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
@@ -51,8 +105,18 @@ async def extract_attachments(
     """
     params = ConversionParams(
         url=url,
-        httpusername=httpusername if httpusername else None,
-        httppassword=httppassword if httppassword else None,
-        password=password if password else None,
+        httpusername=httpusername,
+        httppassword=httppassword,
+        password=password,
     )
+    if recursive:
+        try:
+            return await extract_attachments_recursive(
+                params, max_depth=max_depth, api_key=api_key
+            )
+        except Exception as e:
+            return BaseResponse(
+                status="error",
+                content=str(e),
+            )
     return await extract_pdf_attachments(params, api_key=api_key)
@@ -1,5 +1,16 @@
+import glob
+import os
+import time
+
 from pdfco.mcp.server import mcp
-from pdfco.mcp.services.client import PDFCoClient
+from pdfco.mcp.services.batch import (
+    DEFAULT_CONCURRENCY,
+    SKIPPED_ERROR,
+    gather_limited,
+)
+from pdfco.mcp.services.client import PDFCoClientPool
+from pdfco.mcp.services.file import hash_file, upload_local_file
+from pdfco.mcp.services.preflight import preflight_file, remember_upload
 from pdfco.mcp.models import BaseResponse
 
 from pydantic import Field
@@ -17,21 +28,125 @@ async def upload_file(
     Upload a file to the PDF.co API
     """
     try:
-        async with PDFCoClient(api_key=api_key) as client:
-            response = await client.post(
-                "/v1/file/upload",
-                files={
-                    "file": open(file_path, "rb"),
-                },
-            )
-            res = response.json()
-            return BaseResponse(
-                status="success" if res["status"] == 200 else "error",
-                content=res,
-                tips=f"You can use the url {res['url']} to access the file",
+        preflight = await preflight_file(file_path)
+        res = await upload_local_file(file_path, api_key=api_key)
+        if res["status"] == 200:
+            remember_upload(res["url"], preflight)
+        return BaseResponse(
+            status="success" if res["status"] == 200 else "error",
+            content={**res, "preflight": preflight.model_dump()},
+            tips=f"You can use the url {res['url']} to access the file",
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
+
+
+@mcp.tool()
+async def upload_files(
+    paths: list[str] = Field(
+        description="Absolute paths of files, directories or glob patterns (e.g. '/scans/*.pdf') to upload. Files are uploaded in the listed order; directory contents and glob matches are sorted by name."
+    ),
+    recursive: bool = Field(
+        description="Include files in subdirectories of directories, and let '**' in glob patterns match subdirectories. (Optional)",
+        default=False,
+    ),
+    concurrency: int = Field(
+        description="Maximum number of files uploaded at the same time. (Optional)",
+        default=DEFAULT_CONCURRENCY,
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    Upload many local files to the PDF.co API in parallel.
+    Files with identical content are uploaded once.
+    Returns a mapping of local path to PDF.co URL, and the URLs as a comma-separated list that can be passed to 'pdf_merge'.
+    """
+    start_time = time.time()
+    try:
+        file_paths = _expand_paths(paths, recursive)
+        if not file_paths:
+            return BaseResponse(status="error", content="No files found")
+
+        hashes = await gather_limited(hash_file, file_paths, concurrency)
+        hashes_by_path = dict(zip(file_paths, hashes))
+        unique = {}
+        for file_path, digest in zip(file_paths, hashes):
+            unique.setdefault(digest, file_path)
+
+        async def upload(file_path: str) -> str | Exception:
+            try:
+                preflight = await preflight_file(
+                    file_path, sha256=hashes_by_path[file_path]
+                )
+                res = await upload_local_file(file_path, api_key=api_key)
+                if res.get("status") != 200:
+                    return Exception(res.get("message") or res)
+                remember_upload(res["url"], preflight)
+                return res["url"]
+            except Exception as e:
+                return e
+
+        async with PDFCoClientPool(api_key=api_key):
+            uploaded = await gather_limited(
+                upload,
+                unique.values(),
+                concurrency,
+                skipped=lambda file_path: TimeoutError(SKIPPED_ERROR),
             )
+        urls_by_hash = dict(zip(unique, uploaded))
+
+        files = {}
+        errors = {}
+        for file_path, digest in zip(file_paths, hashes):
+            result = urls_by_hash[digest]
+            if isinstance(result, Exception):
+                errors[file_path] = str(result)
+            else:
+                files[file_path] = result
+
+        return BaseResponse(
+            status="success" if not errors else "error",
+            content={
+                "files": files,
+                "urls": ",".join(files.values()),
+                "uploaded": len(unique),
+                "duplicates": len(file_paths) - len(unique),
+                "errors": errors,
+                "duration": round(time.time() - start_time, 3),
+            },
+            tips="You can pass 'urls' as the comma-separated url of 'pdf_merge'",
+        )
     except Exception as e:
         return BaseResponse(
             status="error",
             content=str(e),
         )
+
+
+def _expand_paths(paths: list[str], recursive: bool) -> list[str]:
+    file_paths = []
+    seen = set()
+    for path in paths:
+        if os.path.isdir(path):
+            pattern = (
+                os.path.join(path, "**", "*") if recursive else os.path.join(path, "*")
+            )
+            matches = sorted(glob.glob(pattern, recursive=recursive))
+        elif glob.has_magic(path):
+            matches = sorted(glob.glob(path, recursive=recursive))
+        else:
+            matches = [path]
+        for match in matches:
+            if os.path.isfile(match):
+                if match not in seen:
+                    seen.add(match)
+                    file_paths.append(match)
+            elif match == path:
+                raise FileNotFoundError(f"File not found: {path}")
+    return file_paths
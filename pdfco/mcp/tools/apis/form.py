@@ -1,5 +1,13 @@
 from pdfco.mcp.server import mcp
-from pdfco.mcp.services.pdf import get_pdf_form_fields_info, fill_pdf_form_fields
+from pdfco.mcp.services.pdf import fill_pdf_form_fields
+from pdfco.mcp.services.batch import DEFAULT_CONCURRENCY
+from pdfco.mcp.services.forms import (
+    fill_forms_bulk,
+    get_cached_form_fields,
+    parse_rows,
+    read_form_fields_info,
+    unknown_field_names,
+)
 from pdfco.mcp.models import BaseResponse, ConversionParams
 
 from pydantic import Field
@@ -19,6 +27,10 @@ async def read_pdf_forms_info(
         default="",
     ),
     password: str = Field(description="Password of PDF file. (Optional)", default=""),
+    refresh: bool = Field(
+        description="Read the fields again instead of using the cached result for this document. (Optional)",
+        default=False,
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
@@ -26,6 +38,7 @@ async def read_pdf_forms_info(
 ) -> BaseResponse:
     """
     Extracts information about fillable PDF fields from an input PDF file.
+    Results are cached per document and reused until the document changes, so the result is returned directly without a job to wait for.
     Ref: https://developer.pdf.co/api-reference/forms/info-reader.md
     """
     params = ConversionParams(
@@ -35,7 +48,15 @@ async def read_pdf_forms_info(
         password=password,
     )
 
-    return await get_pdf_form_fields_info(params, api_key=api_key)
+    try:
+        response = await read_form_fields_info(params, api_key=api_key, refresh=refresh)
+        response.tips = "Use the FieldName values as fieldName in 'fill_forms'"
+        return response
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
 
 
 @mcp.tool(name="fill_forms")
@@ -85,6 +106,16 @@ async def fill_pdf_forms(
         name=name,
     )
 
+    form_fields = await get_cached_form_fields(params)
+    if form_fields is not None and (
+        unknown := unknown_field_names(fields, form_fields)
+    ):
+        return BaseResponse(
+            status="error",
+            content=f"Unknown form fields: {', '.join(unknown)}",
+            tips=f"Valid field names are: {', '.join(list(form_fields)[:50])}",
+        )
+
     return await fill_pdf_form_fields(params, fields=fields, api_key=api_key)
 
 
@@ -146,3 +177,69 @@ async def create_fillable_forms(
     )
 
     return await fill_pdf_form_fields(params, annotations=annotations, api_key=api_key)
+
+
+@mcp.tool(name="fill_forms_bulk")
+async def fill_pdf_forms_bulk(
+    url: str = Field(
+        description="URL to the source PDF form template. Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage. Use 'upload_file' tool to upload local files."
+    ),
+    rows: list[dict] | str = Field(
+        description="Rows of values to fill, one filled PDF per row. Either a list of objects mapping fieldName to value, or CSV text with a header row of field names."
+    ),
+    merge: bool = Field(
+        description="Merge all filled PDFs into a single PDF in row order. (Optional)",
+        default=False,
+    ),
+    concurrency: int = Field(
+        description="Maximum number of fill jobs running at the same time. (Optional)",
+        default=DEFAULT_CONCURRENCY,
+    ),
+    name: str = Field(
+        description="Base file name for the generated outputs. Rows are numbered from 1 (e.g. 'form-1.pdf'). (Optional)",
+        default="",
+    ),
+    httpusername: str = Field(
+        description="HTTP auth user name if required to access source url. (Optional)",
+        default="",
+    ),
+    httppassword: str = Field(
+        description="HTTP auth password if required to access source url. (Optional)",
+        default="",
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    Fill the same PDF form template for many rows of data (mail merge).
+    The template's form fields are read once and every row is validated against them before any job is submitted.
+    Fill jobs run concurrently and the result lists the filled PDF URL of each row, optionally merged into one PDF.
+
+    Example rows:
+    [
+        {"name": "John Doe", "date": "2025-01-01"},
+        {"name": "Jane Doe", "date": "2025-01-02"}
+    ]
+    """
+    params = ConversionParams(
+        url=url,
+        httpusername=httpusername,
+        httppassword=httppassword,
+        name=name,
+    )
+
+    try:
+        return await fill_forms_bulk(
+            params,
+            parse_rows(rows),
+            merge=merge,
+            concurrency=concurrency,
+            api_key=api_key,
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
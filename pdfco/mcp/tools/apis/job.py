@@ -1,39 +1,17 @@
-import asyncio
-import time
 from pdfco.mcp.server import mcp
-from pdfco.mcp.services.client import PDFCoClient
+from pdfco.mcp.services.job import get_job_status, get_job_output_url, wait_for_job
+from pdfco.mcp.services.output import (
+    fetch_output as fetch_job_output,
+    fetch_output_range,
+    is_text_output,
+    stream_text_output,
+)
 from pdfco.mcp.models import BaseResponse
 
+from fastmcp import Context
 from pydantic import Field
 
 
-async def _get_job_status(job_id: str, api_key: str = "") -> BaseResponse:
-    """
-    Internal helper function to check job status without MCP tool decoration
-    """
-    try:
-        async with PDFCoClient(api_key=api_key) as client:
-            response = await client.post(
-                "/v1/job/check",
-                json={
-                    "jobId": job_id,
-                },
-            )
-            json_data = response.json()
-            return BaseResponse(
-                status=json_data["status"],
-                content=json_data,
-                credits_used=json_data.get("credits"),
-                credits_remaining=json_data.get("remainingCredits"),
-                tips="You can download the result if status is success",
-            )
-    except Exception as e:
-        return BaseResponse(
-            status="error",
-            content=str(e),
-        )
-
-
 @mcp.tool()
 async def get_job_check(
     job_id: str = Field(description="The ID of the job to get the status of"),
@@ -51,56 +29,118 @@ async def get_job_check(
     - aborted: background job was aborted.
     - unknown: unknown background job id. Available only when force is set to true for input request.
     """
-    return await _get_job_status(job_id, api_key)
+    return await get_job_status(job_id, api_key)
 
 
 @mcp.tool()
 async def wait_job_completion(
     job_id: str = Field(description="The ID of the job to get the status of"),
     interval: int = Field(
-        description="The interval to check the status of the job (seconds)", default=1
+        description="The initial interval to check the status of the job (seconds). Jobs that report their remaining time are checked near their predicted finish, up to PDFCO_MAX_POLL_INTERVAL apart.",
+        default=1,
     ),
     timeout: int = Field(
         description="The timeout to wait for the job to complete (seconds)", default=300
     ),
+    fetch_output: bool = Field(
+        description="Set to true to stream the output file content (e.g. of 'pdf_to_text' or 'pdf_to_csv') back inline once the job succeeds. Download progress is reported as progress notifications. (Optional)",
+        default=False,
+    ),
+    max_bytes: int = Field(
+        description="Maximum number of output bytes to return inline when fetch_output is true. (Optional)",
+        default=1_000_000,
+    ),
+    encoding: str = Field(
+        description="Character encoding of the output file when fetch_output is true. Detected from the response if empty, falling back to UTF-8. (Optional)",
+        default="",
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
     ),
+    ctx: Context | None = None,
 ) -> BaseResponse:
     """
-    Wait for a job to complete
+    Wait for a job to complete. Checks are scheduled from the job's progress and remaining time when PDF.co reports them, and the percent complete is sent as progress notifications.
     """
-    start_time = time.time()
-    job_check_count = 0
-    credits_used = 0
-    credits_remaining = 0
-    while True:
-        response = await _get_job_status(job_id, api_key=api_key)
-        job_check_count += 1
-        credits_used += response.credits_used or 0
-        credits_remaining = response.credits_remaining or 0
-        if response.status == "success":
-            return BaseResponse(
-                status="success",
-                content=response.content,
-                credits_used=credits_used,
-                credits_remaining=credits_remaining,
-                tips=f"Job check count: {job_check_count}",
-            )
-        elif response.status == "failed":
-            return BaseResponse(
-                status="error",
-                content=response.content,
-                credits_used=credits_used,
-                credits_remaining=credits_remaining,
-            )
-        await asyncio.sleep(interval)
-        if time.time() - start_time > timeout:
-            return BaseResponse(
-                status="error",
-                content="Job timed out",
-                credits_used=credits_used,
-                credits_remaining=credits_remaining,
-                tips=f"Job check count: {job_check_count}",
+
+    async def on_progress(
+        percent: float | None, remaining: float | None, content: dict
+    ):
+        if ctx and percent is not None:
+            message = content.get("message") or "Working"
+            if remaining is not None:
+                message = f"{message}, about {remaining:.0f}s remaining"
+            await ctx.report_progress(percent, 100, message=message)
+
+    response = await wait_for_job(
+        job_id,
+        api_key=api_key,
+        interval=interval,
+        timeout=timeout,
+        on_progress=on_progress,
+    )
+    if response.status == "success" and fetch_output:
+        response.content = await _fetch_inline_output(
+            response.content, max_bytes, encoding, ctx=ctx
+        )
+    return response
+
+
+async def _fetch_inline_output(
+    content: dict, max_bytes: int, encoding: str, ctx: Context | None = None
+) -> dict:
+    """
+    Stream the output file of a finished job into its content, reporting the
+    bytes downloaded as progress notifications along the way
+    """
+    url = content.get("url")
+    if not url:
+        return content
+
+    async def on_progress(received: int, total: int | None):
+        if ctx:
+            await ctx.report_progress(
+                received,
+                min(total, max_bytes) if total else None,
+                message=f"Downloaded {received} bytes",
             )
+
+    try:
+        output, received, truncated = await stream_text_output(
+            url, max_bytes=max_bytes, encoding=encoding, on_progress=on_progress
+        )
+        return {
+            **content,
+            "output": output,
+            "output_bytes": received,
+            "output_truncated": truncated,
+        }
+    except Exception as e:
+        return {**content, "output_error": str(e)}
+
+
+@mcp.resource(
+    "pdfco://jobs/{job_id}/output",
+    description="Output file of a finished job. Downloaded on first read and cached locally.",
+)
+async def job_output(job_id: str) -> str | bytes:
+    url = await get_job_output_url(job_id)
+    return _as_resource_content(url, await fetch_job_output(url))
+
+
+@mcp.resource(
+    "pdfco://jobs/{job_id}/output/{byte_range}",
+    description="Byte range of the output file of a finished job, e.g. pdfco://jobs/{job_id}/output/0-1023 or pdfco://jobs/{job_id}/output/1024-",
+)
+async def job_output_range(job_id: str, byte_range: str) -> str | bytes:
+    start, _, end = byte_range.partition("-")
+    url = await get_job_output_url(job_id)
+    content = await fetch_output_range(url, int(start or 0), int(end) if end else None)
+    return _as_resource_content(url, content)
+
+
+def _as_resource_content(url: str, content: bytes) -> str | bytes:
+    if is_text_output(url):
+        return content.decode("utf-8-sig", errors="replace")
+    return content
@@ -1,7 +1,12 @@
+import json
+
 from pdfco.mcp.server import mcp
 from pdfco.mcp.services.pdf import merge_pdf, split_pdf
+from pdfco.mcp.services.merge import DEFAULT_FAN_IN, merge_tree
+from pdfco.mcp.services.split import split_and_process
 from pdfco.mcp.models import BaseResponse, ConversionParams
 
+from fastmcp import Context
 from pydantic import Field
 
 
@@ -38,6 +43,64 @@ async def pdf_merge(
     )
 
 
+@mcp.tool()
+async def pdf_merge_large(
+    url: str = Field(
+        description="URLs to the source files as a comma-separated list. Supports PDF, DOC, DOCX, RTF, TXT, XLS, XLSX, CSV, images, and more. Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage. Use 'upload_files' tool to upload local files."
+    ),
+    fan_in: int = Field(
+        description="Maximum number of files merged by one job. (Optional)",
+        default=DEFAULT_FAN_IN,
+    ),
+    retries: int = Field(
+        description="Number of times a failed partial merge is retried. (Optional)",
+        default=2,
+    ),
+    httpusername: str = Field(
+        description="HTTP auth user name if required to access source url. (Optional)",
+        default="",
+    ),
+    httppassword: str = Field(
+        description="HTTP auth password if required to access source url. (Optional)",
+        default="",
+    ),
+    name: str = Field(
+        description="File name for the generated output. (Optional)", default=""
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+    ctx: Context | None = None,
+) -> BaseResponse:
+    """
+    Merge a large number of files into a new PDF with a tree of parallel partial merges of at most fan_in files each, then merge the intermediate PDFs.
+    Failed partial merges are retried on their own, and progress is reported as merges finish. Returns the finished result, there is no job to wait for.
+    Ref: https://developer.pdf.co/api-reference/merge/various-files.md
+    """
+
+    async def on_progress(finished: int, total: int, message: str):
+        if ctx:
+            await ctx.report_progress(finished, total, message=message)
+
+    try:
+        return await merge_tree(
+            [source.strip() for source in url.split(",") if source.strip()],
+            ConversionParams(
+                httpusername=httpusername, httppassword=httppassword, name=name
+            ),
+            fan_in=fan_in,
+            retries=retries,
+            api_key=api_key,
+            on_progress=on_progress,
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
+
+
 @mcp.tool()
 async def pdf_split(
     url: str = Field(
@@ -61,13 +124,19 @@ async def pdf_split(
         description="Base file name for the generated output files. (Optional)",
         default="",
     ),
+    follow_up: str = Field(
+        description="Operation to run on each part: text (pdf_to_text), json (pdf_to_json) or invoice (ai_invoice_parser). The follow-ups start only after the split job completes, then run on all parts concurrently, and each part is delivered as a progress notification when its follow-up finishes. Each part is charged as a separate call of that tool. The finished result is returned, there is no job to wait for. (Optional)",
+        default="",
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
     ),
+    ctx: Context | None = None,
 ) -> BaseResponse:
     """
     Split a PDF into multiple PDF files using page indexes or page ranges.
+    With a follow-up, every part is processed further once the split is done.
     Ref: https://developer.pdf.co/api-reference/pdf-split/by-pages.md
     """
     params = ConversionParams(
@@ -79,4 +148,20 @@ async def pdf_split(
         name=name,
     )
 
+    if follow_up:
+
+        async def on_part(part: dict, finished: int, total: int):
+            if ctx:
+                await ctx.report_progress(finished, total, message=json.dumps(part))
+
+        try:
+            return await split_and_process(
+                params, follow_up=follow_up, api_key=api_key, on_part=on_part
+            )
+        except Exception as e:
+            return BaseResponse(
+                status="error",
+                content=str(e),
+            )
+
     return await split_pdf(params, api_key=api_key)
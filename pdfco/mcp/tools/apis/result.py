@@ -0,0 +1,68 @@
+import json
+
+from pdfco.mcp.server import mcp
+from pdfco.mcp.services.output import fetch_output
+from pdfco.mcp.services.result import find_records, shape_records
+from pdfco.mcp.models import BaseResponse
+
+from pydantic import Field
+
+
+@mcp.tool()
+async def read_json_result(
+    url: str = Field(
+        description="URL of the JSON output file of a completed job (e.g. from 'pdf_to_json', 'find_text' or 'read_pdf_forms_info')."
+    ),
+    path: str = Field(
+        description="Dotted path to the list of records in the JSON output (e.g. 'document.page' or 'info.FieldsInfo.Fields'). The largest list in the document is used if empty. (Optional)",
+        default="",
+    ),
+    fields: str = Field(
+        description="Comma-separated keys to keep in each record (e.g. 'text,x,y,pageIndex'). Keeps all keys if empty. (Optional)",
+        default="",
+    ),
+    pages: str = Field(
+        description="Comma-separated page indices (e.g., '0, 1, 2-' or '1, 3-7') of the records to return. Returns records of all pages if empty. (Optional)",
+        default="",
+    ),
+    cursor: str = Field(
+        description="Pagination cursor returned as 'next_cursor' by a previous call. Starts from the first record if empty. (Optional)",
+        default="",
+    ),
+    limit: int = Field(
+        description="Maximum number of records to return, at least 1. (Optional)",
+        default=50,
+    ),
+    max_chars: int = Field(
+        description="Maximum size of the returned records in characters. Records that don't fit are left for the next page; a single record larger than this is returned truncated. (Optional)",
+        default=20000,
+    ),
+) -> BaseResponse:
+    """
+    Read a page of records from a large JSON job output instead of the whole file.
+    Supports field projection, page windows, pagination cursors and size caps.
+    """
+    try:
+        data = json.loads(await fetch_output(url))
+        records_path, records = find_records(data, path)
+        result = shape_records(
+            records,
+            fields=fields,
+            pages=pages,
+            cursor=cursor,
+            limit=limit,
+            max_chars=max_chars,
+        )
+        result["path"] = records_path
+        return BaseResponse(
+            status="success",
+            content=result,
+            tips=f"Call again with cursor='{result['next_cursor']}' to get the next page"
+            if result["next_cursor"]
+            else "All records have been returned",
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
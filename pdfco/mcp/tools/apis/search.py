@@ -1,6 +1,12 @@
 from pdfco.mcp.server import mcp
 from pdfco.mcp.services.pdf import find_text_in_pdf, find_table_in_pdf
 from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.search import (
+    extract_lines,
+    find_table_indexed,
+    find_text_indexed,
+    search_lines,
+)
 
 from pydantic import Field
 
@@ -36,6 +42,14 @@ async def find_text(
         description="Set to True to enable regular expressions in the search string. (Optional)",
         default=False,
     ),
+    use_index: bool = Field(
+        description="Set to True to answer from a local index of the whole document instead of submitting a job. The index is built by one extraction job over all pages on first use, and the result is returned directly without a jobId. Regular expressions are matched with Python syntax. (Optional)",
+        default=False,
+    ),
+    refresh: bool = Field(
+        description="Set to True to rebuild the local index of the document. (Optional)",
+        default=False,
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
@@ -53,6 +67,22 @@ async def find_text(
         password=password,
     )
 
+    if use_index:
+        try:
+            return await find_text_indexed(
+                params,
+                searchString,
+                regexSearch,
+                wordMatchingMode,
+                api_key=api_key,
+                refresh=refresh,
+            )
+        except Exception as e:
+            return BaseResponse(
+                status="error",
+                content=str(e),
+            )
+
     return await find_text_in_pdf(
         params, searchString, regexSearch, wordMatchingMode, api_key=api_key
     )
@@ -78,6 +108,14 @@ async def find_table(
     password: str = Field(
         description="Password of the PDF file. (Optional)", default=""
     ),
+    use_index: bool = Field(
+        description="Set to True to answer from a local index of the whole document instead of submitting a job. On first use, the document is indexed by one text extraction job and its tables are detected by one pdf/find/table job over all pages. Later calls return the table regions of the requested pages from the index directly, without a jobId. (Optional)",
+        default=False,
+    ),
+    refresh: bool = Field(
+        description="Set to True to rebuild the local index of the document. (Optional)",
+        default=False,
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
@@ -95,4 +133,100 @@ async def find_table(
         password=password,
     )
 
+    if use_index:
+        try:
+            return await find_table_indexed(params, api_key=api_key, refresh=refresh)
+        except Exception as e:
+            return BaseResponse(
+                status="error",
+                content=str(e),
+            )
+
     return await find_table_in_pdf(params, api_key=api_key)
+
+
+@mcp.tool(name="find_text_multi")
+async def find_text_multi(
+    url: str = Field(
+        description="URL to the source PDF file. Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage. Use 'upload_file' tool to upload local files."
+    ),
+    searchStrings: list[str] = Field(
+        description="Texts to search. Can be regular expressions if regexSearch is set to True."
+    ),
+    httpusername: str = Field(
+        description="HTTP auth user name if required to access source url. (Optional)",
+        default="",
+    ),
+    httppassword: str = Field(
+        description="HTTP auth password if required to access source url. (Optional)",
+        default="",
+    ),
+    pages: str = Field(
+        description="Comma-separated list of page indices (or ranges) to process. Leave empty for all pages. Example: '0,2-5,7-'. The first-page index is 0. (Optional)",
+        default="",
+    ),
+    password: str = Field(
+        description="Password of the PDF file. (Optional)", default=""
+    ),
+    regexSearch: bool = Field(
+        description="Set to True to treat the search strings as regular expressions. (Optional)",
+        default=False,
+    ),
+    caseSensitive: bool = Field(
+        description="Set to True for case-sensitive matching. (Optional)",
+        default=False,
+    ),
+    wholeWords: bool = Field(
+        description="Set to True to only match whole words. (Optional)",
+        default=False,
+    ),
+    refresh: bool = Field(
+        description="Set to True to rebuild the local index of the document. (Optional)",
+        default=False,
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    Find many texts in PDF at once and get their coordinates. Searches are answered from the local index of the document, so repeated searches don't submit new jobs.
+    Results are grouped by search string with the same coordinates as 'find_text'.
+    """
+    params = ConversionParams(
+        url=url,
+        httpusername=httpusername,
+        httppassword=httppassword,
+        pages=pages,
+        password=password,
+    )
+
+    try:
+        lines, credits_used = await extract_lines(
+            params, api_key=api_key, refresh=refresh
+        )
+        results = search_lines(
+            lines,
+            searchStrings,
+            regex=regexSearch,
+            case_sensitive=caseSensitive,
+            whole_words=wholeWords,
+        )
+        return BaseResponse(
+            status="success",
+            content={
+                "results": results,
+                "counts": {
+                    pattern: len(matches) for pattern, matches in results.items()
+                },
+            },
+            credits_used=credits_used,
+            tips="Searches are already complete, no need to wait for them"
+            if credits_used
+            else "Searched the cached text of the document",
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
@@ -1,6 +1,9 @@
 from pdfco.mcp.server import mcp
 from pdfco.mcp.services.pdf import make_pdf_searchable, make_pdf_unsearchable
-from pdfco.mcp.models import BaseResponse, ConversionParams
+from pdfco.mcp.services.pages import expand_page_ranges
+from pdfco.mcp.services.preflight import get_upload_preflight
+from pdfco.mcp.services.shard import run_sharded
+from pdfco.mcp.models import BaseResponse, ConversionParams, PreflightInfo
 
 from pydantic import Field
 
@@ -32,6 +35,14 @@ async def pdf_make_searchable(
     name: str = Field(
         description="File name for the generated output. (Optional)", default=""
     ),
+    force: bool = Field(
+        description="Run OCR even if the local pre-flight check of a file uploaded with 'upload_file' shows that every requested page already has a text layer. (Optional)",
+        default=False,
+    ),
+    shard_size: int = Field(
+        description="Split large documents into shards of this many consecutive pages that are processed as parallel jobs and merged in page order. The shards are split off by one additional pdf/split job. The result is returned when all shards are done. Disabled if 0. (Optional)",
+        default=0,
+    ),
     api_key: str = Field(
         description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
         default="",
@@ -42,6 +53,14 @@ async def pdf_make_searchable(
     Runs OCR and adds an invisible text layer that can be used for text search.
     Ref: https://developer.pdf.co/api-reference/pdf-change-text-searchable/searchable.md
     """
+    preflight = get_upload_preflight(url)
+    if not force and preflight and _pages_have_text(preflight, pages):
+        return BaseResponse(
+            status="success",
+            content={"url": url, "preflight": preflight.model_dump()},
+            tips="The requested pages already have a text layer, so no OCR job was submitted and the source url is the result. Set force to true to run OCR anyway.",
+        )
+
     params = ConversionParams(
         url=url,
         httpusername=httpusername,
@@ -52,9 +71,27 @@ async def pdf_make_searchable(
         name=name,
     )
 
+    if shard_size:
+        return await run_sharded(
+            "pdf/makesearchable", params, "pdf", shard_size, api_key=api_key
+        )
     return await make_pdf_searchable(params, api_key=api_key)
 
 
+def _pages_have_text(preflight: PreflightInfo, pages: str) -> bool:
+    """
+    Whether the pre-flight check found a text layer on every requested page.
+    False when that is unknown.
+    """
+    if preflight.text_pages is None or not preflight.page_count:
+        return False
+    try:
+        requested = expand_page_ranges(pages, preflight.page_count)
+    except ValueError:
+        return False
+    return bool(requested) and set(requested) <= set(preflight.text_pages)
+
+
 @mcp.tool()
 async def pdf_make_unsearchable(
     url: str = Field(
@@ -1,5 +1,11 @@
 from pdfco.mcp.server import mcp
 from pdfco.mcp.services.pdf import add_pdf_password, remove_pdf_password
+from pdfco.mcp.services.batch import DEFAULT_CONCURRENCY
+from pdfco.mcp.services.preflight import get_upload_preflight
+from pdfco.mcp.services.security import (
+    add_pdf_passwords_bulk,
+    remove_pdf_passwords_bulk,
+)
 from pdfco.mcp.models import BaseResponse, ConversionParams
 
 from pydantic import Field
@@ -147,6 +153,14 @@ async def pdf_remove_password(
     Remove password protection from a PDF file.
     Ref: https://developer.pdf.co/api-reference/pdf-password/remove.md
     """
+    preflight = get_upload_preflight(url)
+    if preflight and preflight.encrypted is False:
+        return BaseResponse(
+            status="success",
+            content={"url": url, "preflight": preflight.model_dump()},
+            tips="The file is not password protected, so no job was submitted and the source url is the result.",
+        )
+
     params = ConversionParams(
         url=url,
         httpusername=httpusername,
@@ -156,3 +170,156 @@ async def pdf_remove_password(
     )
 
     return await remove_pdf_password(params, api_key=api_key)
+
+
+@mcp.tool()
+async def pdf_add_password_bulk(
+    urls: list[str] = Field(
+        description="URLs to the source PDF files. Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage. Use 'upload_files' tool to upload local files."
+    ),
+    owner_password: str = Field(
+        description="The owner password for all files that have no password in 'owner_passwords'.",
+        default="",
+    ),
+    owner_passwords: dict[str, str] = Field(
+        description="Owner passwords per source URL. (Optional)", default={}
+    ),
+    user_passwords: dict[str, str] = Field(
+        description="Optional user passwords per source URL, asked for viewing and printing the document. (Optional)",
+        default={},
+    ),
+    encryption_algorithm: str = Field(
+        description="Encryption algorithm. Valid values: RC4_40bit, RC4_128bit, AES_128bit, AES_256bit. AES_128bit or higher is recommended.",
+        default="AES_256bit",
+    ),
+    allow_accessibility_support: bool = Field(
+        description="Allow or prohibit content extraction for accessibility needs.",
+        default=False,
+    ),
+    allow_assembly_document: bool = Field(
+        description="Allow or prohibit assembling the document.", default=False
+    ),
+    allow_print_document: bool = Field(
+        description="Allow or prohibit printing PDF document.", default=False
+    ),
+    allow_fill_forms: bool = Field(
+        description="Allow or prohibit the filling of interactive form fields (including signature fields) in the PDF documents.",
+        default=False,
+    ),
+    allow_modify_document: bool = Field(
+        description="Allow or prohibit modification of PDF document.", default=False
+    ),
+    allow_content_extraction: bool = Field(
+        description="Allow or prohibit copying content from PDF document.",
+        default=False,
+    ),
+    allow_modify_annotations: bool = Field(
+        description="Allow or prohibit interacting with text annotations and forms in PDF document.",
+        default=False,
+    ),
+    print_quality: str = Field(
+        description="Allowed printing quality. Valid values: HighResolution, LowResolution.",
+        default="",
+    ),
+    httpusername: str = Field(
+        description="HTTP auth user name if required to access source urls. (Optional)",
+        default="",
+    ),
+    httppassword: str = Field(
+        description="HTTP auth password if required to access source urls. (Optional)",
+        default="",
+    ),
+    passwords: dict[str, str] = Field(
+        description="Current passwords per source URL for files that are already password-protected. (Optional)",
+        default={},
+    ),
+    concurrency: int = Field(
+        description="Maximum number of files processed at the same time. (Optional)",
+        default=DEFAULT_CONCURRENCY,
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    Add password protection to many PDF files with the same security settings, running the jobs concurrently.
+    Returns the result of each file with the total duration and credits. Passwords are never included in results or logs.
+    Ref: https://developer.pdf.co/api-reference/pdf-password/add.md
+    """
+    params = ConversionParams(httpusername=httpusername, httppassword=httppassword)
+
+    try:
+        return await add_pdf_passwords_bulk(
+            urls,
+            params,
+            owner_password=owner_password,
+            owner_passwords=owner_passwords,
+            user_passwords=user_passwords,
+            passwords=passwords,
+            concurrency=concurrency,
+            api_key=api_key,
+            EncryptionAlgorithm=encryption_algorithm,
+            AllowAccessibilitySupport=allow_accessibility_support,
+            AllowAssemblyDocument=allow_assembly_document,
+            AllowPrintDocument=allow_print_document,
+            AllowFillForms=allow_fill_forms,
+            AllowModifyDocument=allow_modify_document,
+            AllowContentExtraction=allow_content_extraction,
+            AllowModifyAnnotations=allow_modify_annotations,
+            PrintQuality=print_quality,
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
+
+
+@mcp.tool()
+async def pdf_remove_password_bulk(
+    urls: list[str] = Field(
+        description="URLs to the source PDF files. Supports publicly accessible links including Google Drive, Dropbox, PDF.co Built-In Files Storage. Use 'upload_files' tool to upload local files."
+    ),
+    password: str = Field(
+        description="Password of the files that have no password in 'passwords'. (Optional)",
+        default="",
+    ),
+    passwords: dict[str, str] = Field(
+        description="Passwords to be removed per source URL. (Optional)", default={}
+    ),
+    httpusername: str = Field(
+        description="HTTP auth user name if required to access source urls. (Optional)",
+        default="",
+    ),
+    httppassword: str = Field(
+        description="HTTP auth password if required to access source urls. (Optional)",
+        default="",
+    ),
+    concurrency: int = Field(
+        description="Maximum number of files processed at the same time. (Optional)",
+        default=DEFAULT_CONCURRENCY,
+    ),
+    api_key: str = Field(
+        description="PDF.co API key. If not provided, will use X_API_KEY environment variable. (Optional)",
+        default="",
+    ),
+) -> BaseResponse:
+    """
+    Remove password protection from many PDF files, running the jobs concurrently.
+    Returns the result of each file with the total duration and credits. Passwords are never included in results or logs.
+    Ref: https://developer.pdf.co/api-reference/pdf-password/remove.md
+    """
+    params = ConversionParams(
+        httpusername=httpusername, httppassword=httppassword, password=password
+    )
+
+    try:
+        return await remove_pdf_passwords_bulk(
+            urls, params, passwords=passwords, concurrency=concurrency, api_key=api_key
+        )
+    except Exception as e:
+        return BaseResponse(
+            status="error",
+            content=str(e),
+        )
@@ -0,0 +1,80 @@
+import unittest
+
+from pdfco.mcp.models import ENDPOINT_FIELDS, ConversionParams
+
+SOURCE_KEYS = {"url", "httpusername", "httppassword"}
+HTML_RENDER_KEYS = {
+    "margins",
+    "paperSize",
+    "orientation",
+    "printBackground",
+    "mediaType",
+    "DoNotWaitFullLoad",
+    "header",
+    "footer",
+    "httpusername",
+    "httppassword",
+    "name",
+}
+
+# Request keys each endpoint is expected to receive when every field is set
+EXPECTED_KEYS = {
+    "pdf/convert/to/": SOURCE_KEYS
+    | {"pages", "unwrap", "rect", "lang", "lineGrouping", "password", "name"},
+    "xls/convert/to/": SOURCE_KEYS | {"name", "worksheetIndex"},
+    "pdf/convert/from/doc": SOURCE_KEYS | {"autosize", "pages", "name"},
+    "pdf/convert/from/csv": SOURCE_KEYS | {"autosize", "pages", "name"},
+    "pdf/convert/from/image": SOURCE_KEYS | {"pages", "name"},
+    "pdf/convert/from/url": {"url"} | HTML_RENDER_KEYS,
+    "pdf/convert/from/html": {"html", "templateId", "templateData"} | HTML_RENDER_KEYS,
+    "pdf/convert/from/email": {"url", "margins", "paperSize", "orientation"},
+    "pdf/merge2": SOURCE_KEYS | {"name"},
+    "pdf/split": SOURCE_KEYS | {"pages", "password", "name"},
+    "pdf/info": SOURCE_KEYS | {"password"},
+    "pdf/info/fields": SOURCE_KEYS | {"password"},
+    "pdf/edit/add": SOURCE_KEYS | {"password", "name"},
+    "pdf/find": SOURCE_KEYS | {"pages", "password"},
+    "pdf/find/table": SOURCE_KEYS | {"pages", "password"},
+    "pdf/makesearchable": SOURCE_KEYS | {"lang", "pages", "password", "name"},
+    "pdf/makeunsearchable": SOURCE_KEYS | {"pages", "password", "name"},
+    "pdf/security/add": SOURCE_KEYS | {"password", "name"},
+    "pdf/security/remove": SOURCE_KEYS | {"password", "name"},
+    "pdf/attachments/extract": SOURCE_KEYS | {"password"},
+    "ai-invoice-parser": {"url"},
+}
+
+
+def _all_fields_set() -> ConversionParams:
+    values = {}
+    for field, info in ConversionParams.model_fields.items():
+        values[field] = True if info.annotation is bool else f"{field}-value"
+    return ConversionParams(**values)
+
+
+class PayloadFieldsTest(unittest.TestCase):
+    def test_every_endpoint_has_expected_keys(self):
+        self.assertEqual(set(ENDPOINT_FIELDS), set(EXPECTED_KEYS))
+
+    def test_endpoint_payload_keys(self):
+        params = _all_fields_set()
+        for endpoint, keys in EXPECTED_KEYS.items():
+            # Prefix entries apply to every conversion target
+            requested = endpoint + "json2" if endpoint.endswith("/") else endpoint
+            with self.subTest(endpoint=requested):
+                payload = params.parse_payload(endpoint=requested)
+                self.assertEqual(set(payload), keys | {"async"})
+
+    def test_unlisted_endpoint_receives_every_field(self):
+        payload = _all_fields_set().parse_payload(endpoint="pdf/unlisted")
+        self.assertIn("lineGrouping", payload)
+        self.assertEqual(len(payload), len(ConversionParams.model_fields) + 1)
+
+    def test_empty_fields_are_omitted(self):
+        payload = ConversionParams(url="https://example.com/a.pdf").parse_payload(
+            endpoint="pdf/split"
+        )
+        self.assertEqual(payload, {"async": True, "url": "https://example.com/a.pdf"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+import zlib
+
+from pdfco.mcp.services.preflight import inspect_file
+
+
+def _pdf(*sections: list[tuple[int, bytes]]) -> bytes:
+    """
+    A PDF of the given objects, each section after the first appended as an
+    incremental update
+    """
+    content = b"%PDF-1.7\n"
+    for objects in sections:
+        for number, body in objects:
+            content += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        content += b"trailer\n<< /Root 1 0 R >>\n%%EOF\n"
+    return content
+
+
+def _stream(data: bytes, compress: bool = False) -> bytes:
+    if compress:
+        data = zlib.compress(data)
+        return b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (
+            len(data),
+            data,
+        )
+    return b"<< /Length %d >>\nstream\n%s\nendstream" % (len(data), data)
+
+
+TEXT = b"BT /F1 12 Tf 72 712 Td (Hello) Tj ET"
+DRAWING = b"0 0 m 100 100 l S"
+
+TWO_PAGES = [
+    (1, b"<< /Type /Catalog /Pages 2 0 R >>"),
+    (2, b"<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >>"),
+    (3, b"<< /Type /Page /Parent 2 0 R /Contents 5 0 R >>"),
+    (4, b"<< /Type /Page /Parent 2 0 R /Contents 6 0 R >>"),
+    (5, _stream(TEXT)),
+    (6, _stream(DRAWING, compress=True)),
+]
+
+
+class InspectFileTest(unittest.TestCase):
+    def _inspect(self, content: bytes):
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+        return inspect_file(file.name, "sha")
+
+    def test_page_count_and_text_pages(self):
+        info = self._inspect(_pdf(TWO_PAGES))
+        self.assertEqual(info.page_count, 2)
+        self.assertEqual(info.text_pages, [0])
+        self.assertFalse(info.has_text_layer)
+
+    def test_incremental_update_replaces_objects(self):
+        update = [
+            (3, b"<< /Type /Page /Parent 2 0 R /Contents 7 0 R >>"),
+            (7, _stream(TEXT, compress=True)),
+        ]
+        info = self._inspect(_pdf(TWO_PAGES, update))
+        self.assertEqual(info.page_count, 2)
+        self.assertEqual(info.text_pages, [0])
+
+    def test_incremental_update_removing_a_page(self):
+        update = [(2, b"<< /Type /Pages /Kids [4 0 R] /Count 1 >>")]
+        info = self._inspect(_pdf(TWO_PAGES, update))
+        self.assertEqual(info.page_count, 1)
+        self.assertEqual(info.text_pages, [])
+
+    def test_pages_in_object_stream(self):
+        objects = [
+            b"<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >>",
+            b"<< /Type /Page /Parent 2 0 R /Contents 5 0 R >>",
+            b"<< /Type /Page /Parent 2 0 R /Contents 6 0 R >>",
+        ]
+        offsets = []
+        body = b""
+        for obj in objects:
+            offsets.append(len(body))
+            body += obj + b"\n"
+        header = b" ".join(
+            b"%d %d" % (number, offset) for number, offset in zip((2, 3, 4), offsets)
+        )
+        data = zlib.compress(header + b"\n" + body)
+        object_stream = (
+            b"<< /Type /ObjStm /N 3 /First %d /Length %d /Filter /FlateDecode >>\n"
+            b"stream\n%s\nendstream" % (len(header) + 1, len(data), data)
+        )
+        info = self._inspect(
+            _pdf(
+                [
+                    (1, b"<< /Type /Catalog /Pages 2 0 R >>"),
+                    (5, _stream(TEXT)),
+                    (6, _stream(TEXT)),
+                    (8, object_stream),
+                ]
+            )
+        )
+        self.assertEqual(info.page_count, 2)
+        self.assertTrue(info.has_text_layer)
+
+    def test_count_mismatch_is_unknown(self):
+        update = [(2, b"<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 3 >>")]
+        info = self._inspect(_pdf(TWO_PAGES, update))
+        self.assertIsNone(info.page_count)
+        self.assertIsNone(info.has_text_layer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from pdfco.mcp.services.result import shape_records
+
+RECORDS = [{"page": index, "text": "x" * 100} for index in range(5)]
+
+
+class ShapeRecordsTest(unittest.TestCase):
+    def _follow(self, **kwargs) -> list:
+        items = []
+        cursor = ""
+        for _ in range(len(RECORDS) + 1):
+            result = shape_records(RECORDS, cursor=cursor, **kwargs)
+            items.extend(result["items"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                return items
+        self.fail("next_cursor did not end")
+
+    def test_cursor_pages_through_all_records(self):
+        self.assertEqual(self._follow(limit=2), RECORDS)
+
+    def test_records_larger_than_max_chars_still_advance(self):
+        items = self._follow(max_chars=10)
+        self.assertEqual(len(items), len(RECORDS))
+        self.assertTrue(all(item["_truncated"] for item in items))
+
+    def test_invalid_limit_and_cursor(self):
+        with self.assertRaises(ValueError):
+            shape_records(RECORDS, limit=0)
+        with self.assertRaises(ValueError):
+            shape_records(RECORDS, cursor="-1")
+
+
+if __name__ == "__main__":
+    unittest.main()